@@ -1,12 +1,5 @@
 import numpy as np
 
-# Define two vectors
-u = np.array( [5, 7, 1])
-v = np.array([2, -1, 3])
-
-# Compute the dot product
-dot_product = np.dot(u, v)
-
 # Helper functions
 def angle_degrees(a: np.ndarray, b: np.ndarray) -> float | None:
 	"""Return the angle between vectors a and b in degrees.
@@ -21,56 +14,80 @@ def angle_degrees(a: np.ndarray, b: np.ndarray) -> float | None:
 	cos_theta = np.clip(cos_theta, -1.0, 1.0)
 	return float(np.degrees(np.arccos(cos_theta)))
 
-def classify_by_dot(d: float, tol: float = 1e-12) -> str:
-	"""Classify angle via dot-product sign with tolerance."""
-	if d > tol:
-		return "acute (< 90°)"
-	if d < -tol:
-		return "obtuse (> 90°)"
-	return "right (90°)"
+# Codes returned by classify_by_dot
+ACUTE, RIGHT, OBTUSE = 1, 0, -1
+CLASSIFICATION_LABELS = {
+	ACUTE: "acute (< 90°)",
+	RIGHT: "right (90°)",
+	OBTUSE: "obtuse (> 90°)",
+}
+
+def classify_by_dot(d, norm_a, norm_b, rtol: float = 1e-12) -> np.ndarray:
+	"""Classify angles via dot-product sign, elementwise over arrays.
+	A dot product counts as zero (right angle) when
+	|d| <= rtol * ||a|| * ||b||, so the tolerance scales with the vectors.
+	The norms are required: without them rtol would be an absolute
+	tolerance again.
+	Returns int8 codes (ACUTE, RIGHT, OBTUSE); see CLASSIFICATION_LABELS.
+	"""
+	d = np.asarray(d, dtype=np.float64)
+	right = np.abs(d) <= rtol * np.abs(norm_a) * np.abs(norm_b)
+	return np.where(right, RIGHT, np.sign(d)).astype(np.int8)[()]
+
+def is_orthogonal(d, norm_a, norm_b, rtol: float = 1e-12) -> np.ndarray:
+	"""Elementwise |d| <= rtol * ||a|| * ||b||, as a bool array (norms required)."""
+	d = np.asarray(d, dtype=np.float64)
+	return (np.abs(d) <= rtol * np.abs(norm_a) * np.abs(norm_b))[()]
+
+if __name__ == "__main__":
+	# Define two vectors
+	u = np.array( [5, 7, 1])
+	v = np.array([2, -1, 3])
 
-def is_orthogonal(d: float, tol: float = 1e-12) -> bool:
-	return abs(d) <= tol
+	# Compute the dot product
+	dot_product = np.dot(u, v)
 
-# Print the result
-print("-" * 50)
-print("Vector u:")
-print(u)
-print("\nVector v:")
-print(v)
-print("-" * 50)
-print("Dot product u · v:", dot_product)
-print("=" * 50)
-# Angle and classification
-theta = angle_degrees(u, v)
-if theta is not None:
-	print(f"Angle between u and v: {theta:.3f}°")
-else:
-	print("Angle between u and v: undefined (zero vector involved)")
-print("Classification:", classify_by_dot(dot_product))
-print("Orthogonal (perpendicular)?:", is_orthogonal(dot_product))
+	# Print the result
+	print("-" * 50)
+	print("Vector u:")
+	print(u)
+	print("\nVector v:")
+	print(v)
+	print("-" * 50)
+	print("Dot product u · v:", dot_product)
+	print("=" * 50)
+	# Angle and classification
+	theta = angle_degrees(u, v)
+	if theta is not None:
+		print(f"Angle between u and v: {theta:.3f}°")
+	else:
+		print("Angle between u and v: undefined (zero vector involved)")
+	norm_u = np.linalg.norm(u)
+	norm_v = np.linalg.norm(v)
+	print("Classification:", CLASSIFICATION_LABELS[int(classify_by_dot(dot_product, norm_u, norm_v))])
+	print("Orthogonal (perpendicular)?:", is_orthogonal(dot_product, norm_u, norm_v))
 
-# Projections (using standard dot-product formulas)
-u_dot_u = np.dot(u, u)
-v_dot_v = np.dot(v, v)
+	# Projections (using standard dot-product formulas)
+	u_dot_u = np.dot(u, u)
+	v_dot_v = np.dot(v, v)
 
-# projection of v onto u: (v·u / ||u||^2) u  (same as (u·v / ||u||^2) u)
-proj_v_on_u = (dot_product / u_dot_u) * u
-# projection of u onto v: (u·v / ||v||^2) v
-proj_u_on_v = (dot_product / v_dot_v) * v
+	# projection of v onto u: (v·u / ||u||^2) u  (same as (u·v / ||u||^2) u)
+	proj_v_on_u = (dot_product / u_dot_u) * u
+	# projection of u onto v: (u·v / ||v||^2) v
+	proj_u_on_v = (dot_product / v_dot_v) * v
 
-print("\nProjection of v onto u ( (v·u / ||u||^2) u ):", proj_v_on_u)
-print("Projection of u onto v ( (u·v / ||v||^2) v ):", proj_u_on_v)
+	print("\nProjection of v onto u ( (v·u / ||u||^2) u ):", proj_v_on_u)
+	print("Projection of u onto v ( (u·v / ||v||^2) v ):", proj_u_on_v)
 
-# Key properties demonstration
-print("-" * 50)
-print("Properties check")
-dot_uv = np.dot(u, v)
-dot_vu = np.dot(v, u)
-print("Commutative a·b = b·a:", dot_uv == dot_vu, f"({dot_uv} vs {dot_vu})")
+	# Key properties demonstration
+	print("-" * 50)
+	print("Properties check")
+	dot_uv = np.dot(u, v)
+	dot_vu = np.dot(v, u)
+	print("Commutative a·b = b·a:", dot_uv == dot_vu, f"({dot_uv} vs {dot_vu})")
 
-w = np.array([2, -1, 3])
-left = np.dot(u, v + w)
-right = np.dot(u, v) + np.dot(u, w)
-print("Distributive a·(b+c) = a·b + a·c:", left == right, f"({left} vs {right})")
-print("=" * 50)
+	w = np.array([2, -1, 3])
+	left = np.dot(u, v + w)
+	right = np.dot(u, v) + np.dot(u, w)
+	print("Distributive a·(b+c) = a·b + a·c:", left == right, f"({left} vs {right})")
+	print("=" * 50)
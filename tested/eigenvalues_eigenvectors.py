@@ -2,10 +2,275 @@
 # *** defin a matrix at the bottom and run the analysis ***
 
 import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import minimum_spanning_tree
 from sympy import Matrix
 
-def eigen_analysis(A):
-    M = Matrix(A)
+from matrix_structure import is_symmetric
+
+def _cluster_eigenvalues(values, tol):
+    """
+    Group numerically equal eigenvalues: sort by real part, split where the
+    real parts jump by more than tol, then split each group on the imaginary
+    part the same way. Returns a list of index arrays, one per cluster.
+    """
+    clusters = []
+    order = np.argsort(values.real, kind="stable")
+    breaks = np.flatnonzero(np.diff(values.real[order]) > tol) + 1
+    for group in np.split(order, breaks):
+        group = group[np.argsort(values.imag[group], kind="stable")]
+        sub_breaks = np.flatnonzero(np.diff(values.imag[group]) > tol) + 1
+        clusters.extend(np.split(group, sub_breaks))
+    return clusters
+
+
+def _on_circles(offsets, tol):
+    """
+    True if the points offsets (eigenvalues minus their mean) lie on one
+    or more circles around 0, as the split eigenvalues of Jordan blocks
+    sharing one eigenvalue do: sorted by distance they fall into runs of
+    similar radius (within a factor 2) whose own mean is near 0. Points
+    within tol of 0 (1 x 1 blocks) are ignored. A disk full of unrelated
+    eigenvalues fails.
+    """
+    distances = np.abs(offsets)
+    order = np.argsort(distances)
+    order = order[distances[order] > tol]
+    breaks = np.flatnonzero(distances[order[:-1]] < 0.8 * distances[order[1:]]) + 1
+    for run in np.split(order, breaks):
+        if run.size < 2:
+            return False
+        radius = distances[run[-1]]
+        if distances[run[0]] < 0.5 * radius or abs(offsets[run].mean()) > 0.1 * radius:
+            return False
+    return True
+
+
+def _merge_defective(A, values, clusters, tol, scale):
+    """
+    Merge clusters that together are one defective eigenvalue.
+
+    Round-off of size eps * ||A|| splits an eigenvalue with a Jordan block
+    of size k into k values on a circle of radius about eps^(1/k) * ||A||,
+    far wider than tol for k >= 3. Clusters are joined by single linkage
+    at the radius (tol / scale)^(2/k) * scale (which is tol itself for
+    k = 2): the edges of the minimum spanning tree of the eigenvalues are
+    added shortest first as k grows (union-find), and only the groups of
+    exactly k values are candidates at step k. A candidate is merged only
+    when its values lie within the radius of their mean μ and on circles
+    around it (_on_circles), μ is itself an eigenvalue (smallest singular
+    value of A - μI at most tol) and (A - μI)^k has k singular values
+    below (tol / scale) * ||A - μI||^k, i.e. the generalized eigenspace
+    really has dimension k. The O(n^3) SVDs only run for the rare groups
+    that pass the cheap tests, so ordinary matrices never pay for them.
+    """
+    n = A.shape[0]
+    rel = tol / scale
+
+    # Single linkage at any radius follows the minimum spanning tree of the
+    # eigenvalue distances (zero distances drop out, but those eigenvalues
+    # already share a cluster). Given as a sparse matrix, since csgraph
+    # takes dense entries within 1e-8 of zero for missing edges
+    distances = sparse.csr_matrix(np.abs(values[:, np.newaxis] - values))
+    tree = minimum_spanning_tree(distances).tocoo()
+    order = np.argsort(tree.data, kind="stable")
+    edges = list(zip(tree.data[order].tolist(), tree.row[order].tolist(), tree.col[order].tolist()))
+    if not edges or edges[0][0] > rel ** (2.0 / n) * scale:
+        return clusters
+
+    # Union-find over the eigenvalues; a root knows its clusters, size and
+    # the roots are indexed by group size
+    parent = list(range(n))
+    members = {}
+    size = {}
+    by_size = {}
+    for cluster in clusters:
+        root = int(cluster[0])
+        for i in cluster:
+            parent[i] = root
+        members[root] = [cluster]
+        size[root] = cluster.size
+        by_size.setdefault(cluster.size, set()).add(root)
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    merged = []
+    next_edge = 0
+    for k in range(3, n + 1):
+        radius = rel ** (2.0 / k) * scale
+        if radius <= tol:
+            continue
+
+        while next_edge < len(edges) and edges[next_edge][0] <= radius:
+            _, i, j = edges[next_edge]
+            next_edge += 1
+            a, b = find(i), find(j)
+            if a == b:
+                continue
+            if size[a] < size[b]:
+                a, b = b, a
+            parent[b] = a
+            by_size[size[a]].discard(a)
+            by_size[size[b]].discard(b)
+            members[a].extend(members.pop(b))
+            size[a] += size.pop(b)
+            by_size.setdefault(size[a], set()).add(a)
+
+        for root in by_size.get(k, ()):
+            parts = members[root]
+            if len(parts) < 2:
+                continue
+            joined = np.concatenate(parts)
+            mu = values[joined].mean()
+            # Split Jordan blocks lie on circles around their eigenvalue,
+            # a long single-linkage chain does not
+            offsets = values[joined] - mu
+            if np.abs(offsets).max() > radius or not _on_circles(offsets, tol):
+                continue
+            shifted = A - mu * np.eye(n)
+            if np.linalg.svd(shifted, compute_uv=False)[-1] > tol:
+                continue
+            # Normalized first, so the power cannot overflow
+            power = np.linalg.matrix_power(shifted / np.linalg.norm(shifted), k)
+            if np.count_nonzero(np.linalg.svd(power, compute_uv=False) <= rel) >= k:
+                merged.append(joined)
+
+    if not merged:
+        return clusters
+
+    # A later (larger) merge contains the earlier ones it grew from
+    group_of = np.full(n, -1)
+    for g, joined in enumerate(merged):
+        group_of[joined] = g
+    result = []
+    for cluster in clusters:
+        g = group_of[cluster[0]]
+        if g < 0:
+            result.append(cluster)
+        elif merged[g] is not None:
+            result.append(np.flatnonzero(group_of == g))
+            merged[g] = None
+    return result
+
+
+def numeric_eigenvects(A, tol=None):
+    """
+    Numeric counterpart of SymPy's eigenvects() built on LAPACK eig / eigh.
+
+    Eigenvalues closer than tol are clustered; the cluster size is the
+    algebraic multiplicity. For non-symmetric A, clusters that lie within
+    the wider eps^(1/k) * ||A|| spread of a size-k Jordan block are merged
+    as well when the rank of (A - λI)^k confirms it (_merge_defective).
+    The geometric multiplicity is the null-space dimension of A - λI from
+    its SVD, computed only for repeated eigenvalues (a simple eigenvalue
+    always has exactly one eigenvector).
+
+    Args:
+        A: Square matrix
+        tol: Clustering / null-space tolerance.
+            Defaults to sqrt(eps) * ||A||_F.
+
+    Returns:
+        list of (eigenvalue, algebraic multiplicity, [eigenvectors])
+    """
+    A = np.asarray(A, dtype=np.float64)
+    n = A.shape[0]
+    if A.shape != (n, n):
+        raise ValueError("Matrix must be square")
+
+    symmetric = is_symmetric(A)
+    if symmetric:
+        values, vectors = np.linalg.eigh(A)
+    else:
+        values, vectors = np.linalg.eig(A)
+    values = np.asarray(values, dtype=np.complex128)
+
+    scale = np.linalg.norm(A)
+    if tol is None:
+        tol = np.sqrt(np.finfo(np.float64).eps) * scale
+
+    clusters = _cluster_eigenvalues(values, tol)
+    if not symmetric and tol > 0 and scale > 0:
+        clusters = _merge_defective(A, values, clusters, tol, scale)
+
+    result = []
+    for cluster in clusters:
+        val = values[cluster].mean()
+        val = float(val.real) if abs(val.imag) <= tol else complex(val)
+        alg_mult = cluster.size
+
+        if alg_mult == 1 or symmetric:
+            # Simple eigenvalue, or symmetric (always diagonalizable)
+            vecs = [vectors[:, i] for i in cluster]
+        else:
+            # Geometric multiplicity = dim null(A - λI) from the SVD
+            _, sing, Vh = np.linalg.svd(A - val * np.eye(n))
+            geo_mult = max(1, int(np.count_nonzero(sing <= tol)))
+            vecs = list(Vh[n - geo_mult:].conj())
+
+        result.append((val, alg_mult, vecs))
+
+    return result
+
+
+class EigenDecomposition:
+    """
+    Eigenvalues, multiplicities and eigenvectors from one decomposition.
+
+    Holds the (eigenvalue, algebraic multiplicity, [eigenvectors]) triples
+    of a single eigenvects() call, SymPy or numeric. Everything else is
+    derived from them, so the characteristic polynomial is never factored
+    a second time.
+    """
+
+    def __init__(self, A, numeric=False, tol=None):
+        self.numeric = numeric
+        if numeric:
+            self.eigenvects = numeric_eigenvects(A, tol)
+        else:
+            self.eigenvects = Matrix(A).eigenvects()
+
+    @property
+    def eigenvals(self):
+        """Dict {eigenvalue: algebraic multiplicity}, like SymPy's eigenvals()."""
+        return {val: alg_mult for val, alg_mult, _ in self.eigenvects}
+
+    @property
+    def eigenvalue_list(self):
+        """Sorted list of all eigenvalues, repeated by multiplicity."""
+        lambda_list = []
+        for val, alg_mult, _ in self.eigenvects:
+            lambda_list.extend([val] * alg_mult)
+
+        if self.numeric:
+            return sorted(lambda_list, key=lambda val: (np.real(val), np.imag(val)))
+        return sorted(lambda_list)
+
+    @property
+    def multiplicities(self):
+        """List of (eigenvalue, algebraic, geometric multiplicity)."""
+        return [(val, alg_mult, len(vecs)) for val, alg_mult, vecs in self.eigenvects]
+
+    @property
+    def is_diagonalizable(self):
+        return all(geo_mult == alg_mult for _, alg_mult, geo_mult in self.multiplicities)
+
+
+def eigen_analysis(A, numeric=False, tol=None):
+    """
+    Print eigenvalues, eigenvectors, multiplicities and diagonalizability.
+
+    Args:
+        A: Square matrix
+        numeric: If True use LAPACK (fast, floating point) instead of
+            SymPy's exact symbolic computation
+        tol: Tolerance for the numeric mode, see numeric_eigenvects
+    """
+    M = np.asarray(A) if numeric else Matrix(A)
     n = M.shape[0]
 
     print("=" * 60)
@@ -13,16 +278,10 @@ def eigen_analysis(A):
     print(M)
     print("=" * 60)
 
-    # Eigenvalues (unikke + multiplicitet)
-    eigenvals = M.eigenvals()
-    eigenvects = M.eigenvects()
-
-    # Fuld liste med gentagelser
-    lambda_list = []
-    for val, mult in eigenvals.items():
-        lambda_list.extend([val] * mult)
-
-    lambda_list = sorted(lambda_list)
+    # One decomposition: values, multiplicities and vectors
+    decomposition = EigenDecomposition(A, numeric, tol)
+    eigenvects = decomposition.eigenvects
+    lambda_list = decomposition.eigenvalue_list
 
     print("Egenværdier:")
     for i, val in enumerate(lambda_list, start=1):
@@ -31,8 +290,6 @@ def eigen_analysis(A):
     print("-" * 60)
     print("Egenvektorer og multiplicitet:")
 
-    diagonaliserbar = True
-
     for val, alg_mult, vecs in eigenvects:
         geo_mult = len(vecs)
 
@@ -40,30 +297,45 @@ def eigen_analysis(A):
         print(f"  Algebraisk multiplicitet: {alg_mult}")
         print(f"  Geometrisk multiplicitet: {geo_mult}")
 
-        if geo_mult < alg_mult:
-            diagonaliserbar = False
-
         for i, v in enumerate(vecs, start=1):
-            print(f"  v{i} = {v.T}")
+            print(f"  v{i} = {v if numeric else v.T}")
 
     print("-" * 60)
 
-    if diagonaliserbar:
+    if decomposition.is_diagonalizable:
         print("Matrixen er diagonaliserbar")
     else:
         print("Matrixen er IKKE diagonaliserbar")
-        print("\nJordansk normalform:")
-        J, P = M.jordan_form()
-        print("J =")
-        print(J)
-        print("\n(P er basis-skiftematricen)")
+        if numeric:
+            print("\n(Jordansk normalform kræver symbolsk beregning: numeric=False)")
+        else:
+            print("\nJordansk normalform:")
+            J, P = M.jordan_form()
+            print("J =")
+            print(J)
+            print("\n(P er basis-skiftematricen)")
 
     print("=" * 60)
 
 
-# ====== INDSÆT KUN MATRIXEN HER ======
-A = np.array([[2, 2, 2],
-              [2, 2, 2],
-              [2, 2, 2]])
+if __name__ == "__main__":
+    # Regression check: similar copies of Jordan blocks of size 3 and 4,
+    # whose eigenvalues round-off spreads by about eps^(1/3) and eps^(1/4),
+    # also at a small scale
+    rng = np.random.default_rng(0)
+    for jordan, expected in [(2 * np.eye(3) + np.eye(3, k=1), [(3, 1)]),
+                             (1e-6 * (2 * np.eye(3) + np.eye(3, k=1)), [(3, 1)]),
+                             (2 * np.eye(4) + np.eye(4, k=1), [(4, 1)]),
+                             (np.diag([2.0, 2.0, 2.0, 5.0]) + np.diag([1.0, 1.0, 0.0], k=1),
+                              [(3, 1), (1, 1)])]:
+        for _ in range(20):
+            S = rng.standard_normal(jordan.shape)
+            found = numeric_eigenvects(S @ jordan @ np.linalg.inv(S))
+            assert [(alg, len(vecs)) for _, alg, vecs in found] == expected
+
+    # ====== INDSÆT KUN MATRIXEN HER ======
+    A = np.array([[2, 2, 2],
+                  [2, 2, 2],
+                  [2, 2, 2]])
 
-eigen_analysis(A)
+    eigen_analysis(A)
@@ -1,5 +1,7 @@
 import numpy as np
 
+from pairwise_kernels import pairwise
+
 def euclidean_distance(vec1, vec2):
     """
     Beregn Euclidean distance mellem to vektorer vec1 og vec2.
@@ -13,4 +15,9 @@ v1 = [1, 2, 3]
 v2 = [4, 0, 3]
 
 dist = euclidean_distance(v1, v2)
-print("Euclidean distance:", dist)
\ No newline at end of file
+print("Euclidean distance:", dist)
+
+# Alle par af afstande på én gang (GEMM, i blokke)
+vectors = np.array([v1, v2, [0, 0, 0]])
+print("Pairwise distances:")
+print(pairwise(vectors, metric="euclidean"))
@@ -0,0 +1,140 @@
+import numbers
+from fractions import Fraction
+from math import lcm
+
+import numpy as np
+
+try:
+    # Much faster big-integer arithmetic when available
+    from gmpy2 import mpz as _integer
+except ImportError:
+    _integer = int
+
+
+def integer_rows(M):
+    """
+    Convert a matrix of ints / Fractions (list, NumPy or SymPy) to rows of
+    integers. Each row is scaled by the lcm of its denominators, which
+    changes neither the rank, the pivots nor the RREF.
+
+    Returns:
+        tuple: (rows, scale) with scale the product of the row factors,
+        so det(rows) = scale * det(M)
+    """
+    entries = np.array(M, dtype=object)
+    if entries.ndim != 2:
+        raise ValueError("Input must be a 2D matrix")
+
+    rows = []
+    scale = 1
+    for row in entries.tolist():
+        if not all(isinstance(x, numbers.Rational) for x in row):
+            raise TypeError("Exact elimination requires integer or Fraction entries")
+        row = [Fraction(int(x.numerator), int(x.denominator)) for x in row]
+        denom = lcm(*(x.denominator for x in row)) if row else 1
+        rows.append([_integer(x.numerator * (denom // x.denominator)) for x in row])
+        scale *= denom
+    return rows, scale
+
+
+def fraction_free_echelon(rows, num_cols):
+    """
+    Fraction-free (Bareiss) forward elimination on integer rows, in place.
+
+    Below each pivot, row i becomes
+        (pivot * row_i - row_i[col] * pivot_row) / previous_pivot
+    and the division is always exact, so all entries stay integers no
+    larger than the minors of the matrix. Columns without a pivot are
+    skipped, which makes it work for any shape and rank.
+
+    Returns:
+        tuple: (pivot_cols, sign) where rows[:rank] is then an integer
+        echelon form and sign is the parity of the row swaps (+1 or -1).
+        For a nonsingular square matrix det = sign * rows[-1][-1].
+    """
+    m = len(rows)
+    pivot_cols = []
+    sign = 1
+    prev = _integer(1)
+    r = 0
+
+    for col in range(num_cols):
+        if r == m:
+            break
+        p = next((i for i in range(r, m) if rows[i][col] != 0), None)
+        if p is None:
+            continue
+        if p != r:
+            rows[r], rows[p] = rows[p], rows[r]
+            sign = -sign
+
+        pivot_row = rows[r]
+        pivot = pivot_row[col]
+        tail = pivot_row[col + 1:]
+        for i in range(r + 1, m):
+            row = rows[i]
+            a = row[col]
+            if a == 0:
+                row[col + 1:] = [pivot * x // prev for x in row[col + 1:]]
+            else:
+                row[col + 1:] = [(pivot * x - a * y) // prev for x, y in zip(row[col + 1:], tail)]
+                row[col] = 0
+
+        prev = pivot
+        pivot_cols.append(col)
+        r += 1
+
+    return tuple(pivot_cols), sign
+
+
+def rref_exact(M):
+    """
+    Compute the exact RREF of an integer or rational matrix without SymPy.
+
+    Fraction-free forward elimination (Python ints, gmpy2.mpz if
+    installed) gives the pivots and an integer echelon form U. With d the
+    last pivot (the determinant of the pivot block), d * RREF is integral
+    (Cramer's rule), so the non-pivot columns follow from a fraction-free
+    back substitution in which every division is exact.
+
+    Args:
+        M: Matrix of ints / Fractions of shape (m, n)
+
+    Returns:
+        tuple: (rref_matrix, pivot_cols) like SymPy, with rref_matrix as
+        a NumPy object array of Fractions and pivot_cols a tuple of ints
+    """
+    rows, _ = integer_rows(M)
+    m = len(rows)
+    n = len(rows[0]) if rows else np.shape(M)[1]
+
+    pivot_cols, _ = fraction_free_echelon(rows, n)
+    rank = len(pivot_cols)
+
+    R = np.full((m, n), Fraction(0), dtype=object)
+    if rank == 0:
+        return R, pivot_cols
+    d = rows[rank - 1][pivot_cols[-1]]
+
+    # X[i][j] = d * RREF[i, j] for the non-pivot columns j, bottom row first
+    pivot_set = set(pivot_cols)
+    free = [j for j in range(n) if j not in pivot_set]
+    X = [[0] * len(free) for _ in range(rank)]
+    for i in reversed(range(rank)):
+        row = rows[i]
+        pivot_col = pivot_cols[i]
+        for t, j in enumerate(free):
+            if j < pivot_col:
+                continue
+            s = d * row[j]
+            for k in range(i + 1, rank):
+                if pivot_cols[k] > j:
+                    break
+                s -= row[pivot_cols[k]] * X[k][t]
+            X[i][t] = s // row[pivot_col]
+
+        R[i, pivot_col] = Fraction(1)
+        for t, j in enumerate(free):
+            R[i, j] = Fraction(int(X[i][t]), int(d))
+
+    return R, pivot_cols
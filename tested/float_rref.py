@@ -0,0 +1,247 @@
+import numpy as np
+
+
+def default_tolerance(M):
+    """
+    Zero threshold used when none is given, one value per matrix and
+    column: max(m, n) * eps * max|entry of the column|. Scaling by column
+    keeps a column of large entries (such as a big right-hand side b)
+    from hiding the pivots of columns with small ones.
+    """
+    m, n = M.shape[-2:]
+    if M.size == 0:
+        return np.zeros(M.shape[:-2] + (n,))
+    return max(m, n) * np.finfo(np.float64).eps * np.abs(M).max(axis=-2)
+
+
+def independent_columns(M):
+    """
+    Greedy left-to-right choice of linearly independent columns (the RREF
+    pivot columns) for a stack of matrices, by Gram-Schmidt with
+    reorthogonalization (CGS2).
+
+    Column j is kept when its distance to the span of the kept columns
+    exceeds the round-off that projection can leave behind,
+        max(m, n) * eps * (||a_j|| + sum_i |c_i| ||a_i||),
+    where a_j ≈ sum_i c_i a_i over the kept columns a_i. Unlike a fixed
+    threshold on elimination residues this follows the actual error
+    growth, and every column is judged on its own scale.
+
+    Args:
+        M: Array of shape (k, m, n)
+
+    Returns:
+        np.ndarray: Boolean mask of shape (k, n)
+    """
+    k, m, n = M.shape
+    rtol = max(m, n) * np.finfo(np.float64).eps
+    size = min(m, n)
+    Q = np.zeros((k, m, size))
+    R_inv = np.zeros((k, size, size))         # inverse of the R factor of the kept columns
+    kept_norms = np.zeros((k, size))
+    count = np.zeros(k, dtype=np.intp)
+    mask = np.zeros((k, n), dtype=bool)
+
+    for j in range(n):
+        a = M[:, :, j]
+        v = a.copy()
+        coefficients = np.zeros((k, size))
+        for _ in range(2):
+            step = np.einsum("kmr,km->kr", Q, v)
+            v -= np.einsum("kmr,kr->km", Q, step)
+            coefficients += step
+        norm = np.linalg.norm(v, axis=1)
+
+        # Coefficients of a_j in terms of the kept columns themselves
+        c = np.einsum("krs,ks->kr", R_inv, coefficients)
+        a_norm = np.linalg.norm(a, axis=1)
+        bound = rtol * (a_norm + np.einsum("kr,kr->k", np.abs(c), kept_norms))
+
+        keep = (norm > bound) & (count < size)
+        idx = np.flatnonzero(keep)
+        if idx.size:
+            slot = count[idx]
+            Q[idx, :, slot] = v[idx] / norm[idx, np.newaxis]
+            # New column of R^(-1): [-R^(-1) r / d ; 1 / d] for R -> [[R, r], [0, d]]
+            R_inv[idx, :, slot] = -c[idx] / norm[idx, np.newaxis]
+            R_inv[idx, slot, slot] = 1.0 / norm[idx]
+            kept_norms[idx, slot] = a_norm[idx]
+            count[idx] += 1
+            mask[idx, j] = True
+
+    return mask
+
+
+def eliminate_stack(R, tol=None, reduced=True):
+    """
+    Gauss(-Jordan) elimination of a stack of matrices, in place.
+
+    All k matrices are reduced in one pass over the columns. For each column
+    every matrix picks its own pivot (largest magnitude on or below its
+    current row) and the trailing columns are updated with one vectorized
+    rank-1 update.
+
+    Args:
+        R: Float64 array of shape (k, m, n), overwritten with the result
+        tol: Entries with magnitude <= tol count as zero. Scalar, one
+            value per matrix (k,) or per matrix and column (k, n).
+            By default the pivot columns come from independent_columns
+            and default_tolerance(R) only cleans up round-off.
+        reduced: If True eliminate above and below each pivot (RREF),
+            otherwise only below it (REF)
+
+    Returns:
+        np.ndarray: Boolean pivot mask of shape (k, n)
+    """
+    k, m, n = R.shape
+    chosen = None
+    if tol is None:
+        chosen = independent_columns(R)
+        tol = default_tolerance(R)
+    tol = np.asarray(tol, dtype=np.float64)
+    if tol.ndim <= 1:
+        tol = np.broadcast_to(tol, (k,))[:, np.newaxis]
+    tol = np.broadcast_to(tol, (k, n))
+
+    pivot_mask = np.zeros((k, n), dtype=bool)
+    current_row = np.zeros(k, dtype=np.intp)
+    batch = np.arange(k)
+    row_index = np.arange(m)
+    pivot_scale = np.ones((k, m))
+
+    for col in range(n):
+        active = current_row < m
+        if not active.any():
+            break
+
+        # Pivot search: rows above the current row are not candidates
+        magnitude = np.abs(R[:, :, col])
+        magnitude[row_index[np.newaxis, :] < current_row[:, np.newaxis]] = -1.0
+        pivot_row = np.argmax(magnitude, axis=1)
+        if chosen is None:
+            has_pivot = active & (magnitude[batch, pivot_row] > tol[:, col])
+        else:
+            has_pivot = active & chosen[:, col] & (magnitude[batch, pivot_row] > 0)
+        if not has_pivot.any():
+            continue
+
+        idx = batch[has_pivot]
+        r = current_row[has_pivot]
+        p = pivot_row[has_pivot]
+
+        # Swap pivot row into place
+        swapped = R[idx, p]
+        R[idx, p] = R[idx, r]
+        R[idx, r] = swapped
+
+        # Scale pivot row so the leading entry is 1
+        pivot_scale[idx, r] = np.abs(R[idx, r, col])
+        R[idx, r, col:] /= R[idx, r, col][:, np.newaxis]
+
+        # Eliminate the column in the other rows (rank-1 update). For REF
+        # only the trailing rows below the highest pivot row are touched.
+        low = 0 if reduced else int(r.min())
+        factors = R[idx, low:, col].copy()
+        if reduced:
+            factors[np.arange(idx.size), r - low] = 0.0
+        else:
+            factors[row_index[np.newaxis, low:] <= r[:, np.newaxis]] = 0.0
+        update = factors[:, :, np.newaxis] * R[idx, r, np.newaxis, col:]
+        if idx.size == k:
+            # Every matrix has a pivot: update through a view, no gather
+            R[:, low:, col:] -= update
+        else:
+            R[idx, low:, col:] -= update
+
+        pivot_mask[idx, col] = True
+        current_row[has_pivot] += 1
+
+    # Rows below the last pivot hold only round-off; clean up the rest
+    R[row_index[np.newaxis, :] >= current_row[:, np.newaxis]] = 0.0
+    if chosen is None:
+        # Pivot rows were divided by their pivot, and so was their round-off
+        R[np.abs(R) <= tol[:, np.newaxis, :] / pivot_scale[:, :, np.newaxis]] = 0.0
+    else:
+        R[np.abs(R) <= tol[:, np.newaxis, :]] = 0.0
+
+    return pivot_mask
+
+
+def rref_stack(M, tol=None):
+    """
+    Compute the RREF of a stack of matrices with partial pivoting.
+
+    Args:
+        M: Array of shape (k, m, n) (or a single (m, n) matrix)
+        tol: Entries with magnitude <= tol count as zero. Scalar, one
+            value per matrix or per matrix and column. By default every
+            column is judged on its own scale (see independent_columns),
+            so in [A | b] a large b cannot hide the pivots of A.
+
+    Returns:
+        tuple: (R, pivot_mask) where R has the shape of M and pivot_mask
+        is a boolean array of shape (k, n) marking the pivot columns
+    """
+    R = np.array(M, dtype=np.float64)
+    single = R.ndim == 2
+    if single:
+        R = R[np.newaxis]
+    if R.ndim != 3:
+        raise ValueError("Input must be a matrix or a stack of matrices")
+
+    pivot_mask = eliminate_stack(R, tol, reduced=True)
+
+    if single:
+        return R[0], pivot_mask[0]
+    return R, pivot_mask
+
+
+def rref_float(M, tol=None):
+    """
+    Compute the RREF of a single floating-point matrix.
+    NumPy counterpart of SymPy's Matrix.rref() using partial pivoting.
+
+    Args:
+        M: Matrix of shape (m, n)
+        tol: Entries with magnitude <= tol count as zero
+
+    Returns:
+        tuple: (rref_matrix, pivot_cols) like SymPy, with rref_matrix
+        as a float64 NumPy array and pivot_cols as a tuple of ints
+    """
+    M = np.asarray(M, dtype=np.float64)
+    if M.ndim != 2:
+        raise ValueError("Input must be a 2D matrix")
+
+    R, pivot_mask = rref_stack(M, tol)
+    return R, tuple(int(col) for col in np.flatnonzero(pivot_mask))
+
+
+if __name__ == "__main__":
+    # Regression check: integer-valued float matrix of rank 3 where fixed
+    # thresholds on elimination residues used to report rank 4
+    A = np.array([[8, 19, 34, -12],
+                  [3, 6, 5, -47],
+                  [-4, -10, -20, -12],
+                  [12, 39, -42, 48],
+                  [23, 65, -9, 1]], dtype=np.float64)
+    b = np.array([-39, -8, 22, 45, 5], dtype=np.float64)
+
+    rref_matrix, pivot_cols = rref_float(np.column_stack([A, b]))
+    print("-" * 50)
+    print("RREF of [A | b]:")
+    print(rref_matrix)
+    print("Pivot columns:", pivot_cols)
+    assert pivot_cols == (0, 1, 2), pivot_cols
+    print("-" * 50)
+
+    # Regression check: a huge b must not hide the (small) pivots of A;
+    # diag(1e-3, 1e-3) x = [1e14, 1] has the unique solution [1e17, 1e3]
+    augmented = np.array([[[1e-3, 0.0, 1e14],
+                           [0.0, 1e-3, 1.0]]])
+    rref_matrix, pivot_mask = rref_stack(augmented)
+    print("RREF of [diag(1e-3, 1e-3) | (1e14, 1)]:")
+    print(rref_matrix[0])
+    assert pivot_mask[0].tolist() == [True, True, False], pivot_mask
+    assert np.allclose(rref_matrix[0, :, -1], [1e17, 1e3])
+    print("=" * 50)
@@ -1,41 +1,46 @@
 import numpy as np
 from sympy import Matrix
 
-def row_echelon_form(matrix):
-    """Convert matrix to row echelon form (REF) using Gaussian elimination."""
-    M = matrix.copy()
-    rows, cols = M.shape
-    current_row = 0
-    
-    for col in range(cols):
-        # Find pivot
-        pivot_row = None
-        for row in range(current_row, rows):
-            if M[row, col] != 0:
-                pivot_row = row
-                break
-        
-        if pivot_row is None:
-            continue
-        
-        # Swap rows if needed
-        if pivot_row != current_row:
-            M[[current_row, pivot_row]] = M[[pivot_row, current_row]]
-        
-        # Scale pivot row so leading entry is 1
-        pivot_value = M[current_row, col]
-        M[current_row] = M[current_row] / pivot_value
-        
-        # Eliminate below
-        for row in range(current_row + 1, rows):
-            if M[row, col] != 0:
-                factor = M[row, col]
-                M[row] = M[row] - factor * M[current_row]
-        
-        current_row += 1
-        if current_row >= rows:
-            break
-    
+from float_rref import default_tolerance, eliminate_stack
+
+def row_echelon_form(matrix, copy=True, tol=None):
+    """
+    Convert matrix to row echelon form (REF) using Gaussian elimination.
+
+    Uses partial pivoting (largest magnitude pivot) and eliminates the
+    whole trailing submatrix with one rank-1 update per pivot.
+    Also accepts a stack of matrices with shape (..., m, n).
+
+    Args:
+        matrix: Matrix (m, n) or stack of matrices (..., m, n)
+        copy: If False, work in place on the caller's float64 array
+        tol: Entries with magnitude <= tol count as zero. Defaults to
+            default_tolerance per column; unlike the RREF, the REF does
+            not pay for the separate rank-revealing independent_columns pass
+
+    Returns:
+        np.ndarray: The REF (the input array itself when copy=False)
+    """
+    if copy:
+        M = np.array(matrix, dtype=np.float64)
+    else:
+        if not isinstance(matrix, np.ndarray) or matrix.dtype != np.float64:
+            raise ValueError("copy=False requires a float64 NumPy array")
+        M = matrix
+
+    if M.ndim < 2:
+        raise ValueError("Input must be a matrix or a stack of matrices")
+
+    # View the input as a (k, m, n) stack and eliminate all at once
+    stack = M.reshape((-1,) + M.shape[-2:])
+    if tol is None:
+        tol = default_tolerance(stack)
+    eliminate_stack(stack, tol, reduced=False)
+
+    # Non-contiguous input gets a reshaped copy; write the result back
+    if not np.shares_memory(stack, M):
+        M[...] = stack.reshape(M.shape)
+
     return M
 
 # Define the augmented matrix [A | b]
@@ -1,12 +1,15 @@
 import numpy as np
 import sympy as sp
 
+from matrix_structure import detect_structure
+
 # Define the matrix A as a NumPy array
 A = np.array([[2, 3],
               [4, 5]])
 
-# Check if the matrix is symmetric
-is_symmetric = np.allclose(A, A.T)
+# Check if the matrix is symmetric (and which other structure it has)
+structure = detect_structure(A)
+is_symmetric = structure["symmetric"]
 
 #Calculate the matrix as the sum of a symmetric matrix
 S = (A + A.T) / 2
@@ -23,6 +26,7 @@ print("Transpose of A:")
 print(A.T)
 print("-" * 50)
 print("Is matrix symmetric?", is_symmetric)
+print("Detected structure:", structure["kind"])
 print("=" * 50)
 print("Symmetric part S:")
 print(S)
@@ -1,16 +1,25 @@
 import numpy as np
+from scipy import sparse
 from sympy import Matrix
 
+from float_rref import rref_float
+from sparse_systems import sparse_rref
+
 # Define the matrix A as a NumPy array
 A = np.array([[1, 4, 2],
               [0, 0, 1],
               [0, 0, 0]])
 
-# Convert NumPy array to SymPy Matrix
-sympy_matrix = Matrix(A)
-
 # Compute RREF to identify pivot columns
-rref_matrix, pivot_cols = sympy_matrix.rref()
+if sparse.issparse(A):
+    # Sparse input: sparse elimination, never densified
+    rref_matrix, pivot_cols = sparse_rref(A)
+elif np.issubdtype(A.dtype, np.floating):
+    # Float input: NumPy RREF with partial pivoting
+    rref_matrix, pivot_cols = rref_float(A)
+else:
+    # Exact input: convert NumPy array to SymPy Matrix
+    rref_matrix, pivot_cols = Matrix(A).rref()
 
 # Get dimensions
 rows, cols = A.shape
@@ -19,8 +28,9 @@ rows, cols = A.shape
 leading_variables = []
 free_variables = []
 
+pivot_set = set(pivot_cols)
 for col in range(cols):
-    if col in pivot_cols:
+    if col in pivot_set:
         leading_variables.append((col, f"x{col+1}"))
     else:
         free_variables.append((col, f"x{col+1}"))
@@ -31,7 +41,10 @@ print("Matrix A:")
 print(A)
 print("-" * 50)
 print("RREF of Matrix A:")
-print(np.array(rref_matrix, dtype=np.float64))
+if sparse.issparse(rref_matrix):
+    print(rref_matrix)
+else:
+    print(np.array(rref_matrix, dtype=np.float64))
 print("-" * 50)
 print("LEADING VARIABLES (Pivot columns):")
 if leading_variables:
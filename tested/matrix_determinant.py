@@ -1,4 +1,11 @@
+import warnings
+from fractions import Fraction
+
 import numpy as np
+from scipy.linalg import LinAlgWarning, lu_factor
+
+from exact_rref import fraction_free_echelon, integer_rows
+from modular_linalg import modular_determinant
 
 
 def determinant_2x2(matrix):
@@ -78,43 +85,187 @@ def determinant_nxn(matrix):
     return np.linalg.det(matrix)
 
 
-def determinant(matrix):
+def lu_packed(matrix):
+    """
+    Factor a square matrix with partially pivoted LU in packed form
+    (LAPACK getrf through scipy.linalg.lu_factor).
+
+    L (unit lower, without its diagonal) and U are stored in one array,
+    and the row permutation is kept as an index vector instead of a dense P.
+
+    Returns:
+        tuple: (LU, perm, sign) where A[perm] = L @ U and sign is the
+        parity of the permutation (+1 or -1)
+    """
+    matrix = np.array(matrix, dtype=float)
+    n = matrix.shape[0]
+
+    if matrix.shape != (n, n):
+        raise ValueError("Matrix must be square")
+
+    with warnings.catch_warnings():
+        # A singular matrix is fine here: its determinant is 0
+        warnings.simplefilter("ignore", LinAlgWarning)
+        LU, piv = lu_factor(matrix)
+
+    # LAPACK pivots mean "row k was swapped with row piv[k]", in order
+    perm = np.arange(n)
+    for k, p in enumerate(piv.tolist()):
+        perm[k], perm[p] = perm[p], perm[k]
+    sign = -1.0 if np.count_nonzero(piv != np.arange(n)) % 2 else 1.0
+
+    return LU, perm, sign
+
+
+def _log_abs_diagonal(LU, sign):
+    """(sign, log|det|) from the packed LU factors and the pivot parity."""
+    diagonal = np.diagonal(LU)
+
+    if np.any(diagonal == 0):
+        return 0.0, -np.inf
+
+    sign = sign * np.prod(np.sign(diagonal))
+    logabsdet = np.sum(np.log(np.abs(diagonal)))
+    return float(sign), float(logabsdet)
+
+
+def log_abs_determinant(matrix):
+    """
+    Calculate sign and log|det| of a square matrix using LU factorization.
+    Unlike the determinant itself this does not overflow or underflow
+    for large matrices.
+
+    Returns:
+        tuple: (sign, logabsdet) with det = sign * exp(logabsdet).
+        A singular matrix gives (0.0, -inf).
+    """
+    LU, _, sign = lu_packed(matrix)
+    return _log_abs_diagonal(LU, sign)
+
+
+def determinant_lu(matrix):
+    """
+    Calculate the determinant of any n x n matrix using LU factorization.
+    det(A) = sign(P) * product of the diagonal of U, in O(n^3) time.
+
+    When the running product leaves the float64 range (large n), the
+    determinant comes from log|det| instead, so a determinant that fits
+    is still returned. One that does not raises OverflowError; use
+    log_abs_determinant for those.
+    """
+    LU, _, sign = lu_packed(matrix)
+    with np.errstate(over="ignore", under="ignore"):
+        det = sign * np.prod(np.diagonal(LU))
+    if det != 0 and np.isfinite(det) or np.any(np.diagonal(LU) == 0):
+        return float(det)
+
+    sign, logabsdet = _log_abs_diagonal(LU, sign)
+    if logabsdet > np.log(np.finfo(np.float64).max):
+        raise OverflowError("Determinant exceeds the float64 range, use log_abs_determinant")
+    return sign * float(np.exp(logabsdet))
+
+
+def determinant_bareiss(matrix):
+    """
+    Calculate the exact determinant of an integer or rational matrix.
+    Uses fraction-free Bareiss elimination on Python ints (gmpy2.mpz if
+    installed), the same kernel as exact_rref: the last pivot is the
+    determinant up to the sign of the row swaps.
+    Rational rows are scaled to integers first (exact_rref.integer_rows).
+
+    Args:
+        matrix: Square matrix of ints / Fractions (list, NumPy or SymPy)
+
+    Returns:
+        int or Fraction: The exact determinant
+    """
+    rows, scale = integer_rows(matrix)
+    n = len(rows)
+    if any(len(row) != n for row in rows):
+        raise ValueError("Matrix must be square")
+
+    if n == 0:
+        return 1
+    pivot_cols, sign = fraction_free_echelon(rows, n)
+    if len(pivot_cols) < n:
+        return 0
+
+    det = Fraction(int(sign * rows[-1][-1]), scale)
+    return det.numerator if det.denominator == 1 else det
+
+
+# Largest size the cofactor expansion is allowed to "explain" (O(n!) time)
+EXPLAIN_MAX_SIZE = 8
+
+
+def determinant(matrix, method="lu"):
     """
     Automatically calculate the determinant of any square matrix.
     Chooses the best method based on matrix size.
+
+    Args:
+        matrix: Square matrix (array-like)
+        method: "lu" (default) uses closed formulas for 2x2 / 3x3 and
+            LU factorization for larger matrices.
+            "explain" uses cofactor expansion, only for small matrices.
+            "exact" uses Bareiss elimination on integer / Fraction input.
+            "modular" is exact too, using elimination modulo several
+            31-bit primes and the CRT (faster for large matrices).
+
+    Returns:
+        float: The determinant (int or Fraction for "exact" / "modular").
+        "lu" raises OverflowError when it is beyond the float64 range;
+        log_abs_determinant handles those.
     """
+    if method == "exact":
+        return determinant_bareiss(matrix)
+    if method == "modular":
+        return modular_determinant(matrix)
+
     matrix = np.array(matrix, dtype=float)
     n = matrix.shape[0]
     
     if matrix.shape != (n, n):
         raise ValueError("Matrix must be square")
     
+    if method == "explain":
+        if n > EXPLAIN_MAX_SIZE:
+            raise ValueError(
+                f"Cofactor expansion is only supported up to "
+                f"{EXPLAIN_MAX_SIZE}x{EXPLAIN_MAX_SIZE}"
+            )
+        return determinant_recursive(matrix)
+    if method != "lu":
+        raise ValueError(f"Unknown method: {method!r}")
+    
     # Use specialized methods for small matrices
     if n == 2:
         return determinant_2x2(matrix)
     elif n == 3:
         return determinant_3x3(matrix)
     else:
-        # Use recursive method for larger matrices
-        return determinant_recursive(matrix)
-
+        # Use LU factorization for larger matrices
+        return determinant_lu(matrix)
 
 
 
-# Define the matrix A as a NumPy array
-A = np.array([[1, 4],
-              [5, 2]])
 
-# Compute the determinant (automatically chooses the right method)
-det_result = determinant(A)
-det_numpy = np.linalg.det(A)
+if __name__ == "__main__":
+    # Define the matrix A as a NumPy array
+    A = np.array([[1, 4],
+                  [5, 2]])
 
-# Print the result
-print("-" * 50)
-print("Matrix A:")
-print(A)
-print("-" * 50)
-print(f"Determinant: {det_result}")
-print(f"NumPy verification: {det_numpy}")
-print("=" * 50)
+    # Compute the determinant (automatically chooses the right method)
+    det_result = determinant(A)
+    det_numpy = np.linalg.det(A)
 
+    # Print the result
+    print("-" * 50)
+    print("Matrix A:")
+    print(A)
+    print("-" * 50)
+    print(f"Determinant: {det_result}")
+    print(f"Exact (Bareiss): {determinant(A, method='exact')}")
+    print(f"Exact (modular): {determinant(A, method='modular')}")
+    print(f"NumPy verification: {det_numpy}")
+    print("=" * 50)
@@ -1,21 +1,28 @@
 import numpy as np
 from sympy import Matrix
 
+from matrix_inverse import apply_inverse
+from matrix_structure import detect_structure, eig_structured
+
 # Define the matrix A as a NumPy array
 A = np.array([[1, 0, 1],
               [0, 1, 0],
               [0, 0, -3]], dtype=np.float64)
 
-# Convert to SymPy Matrix
-sympy_matrix = Matrix(A)
-
 # Compute diagonalization: A = P @ D @ P^(-1)
-P, D = sympy_matrix.diagonalize()
+structure = detect_structure(A)
+if structure["symmetric"]:
+    # Symmetric: eigh gives an orthonormal P, so P^(-1) = P^T
+    eigenvalues, numpy_P = eig_structured(A, structure)
+    numpy_D = np.diag(eigenvalues)
+else:
+    # Convert to SymPy Matrix
+    sympy_matrix = Matrix(A)
+    P, D = sympy_matrix.diagonalize()
 
-# Convert to NumPy arrays
-numpy_P = np.array(P, dtype=np.float64)
-numpy_D = np.array(D, dtype=np.float64)
-numpy_P_inv = np.linalg.inv(numpy_P)
+    # Convert to NumPy arrays
+    numpy_P = np.array(P, dtype=np.float64)
+    numpy_D = np.array(D, dtype=np.float64)
 
 # Print the result
 print("-" * 50)
@@ -29,5 +36,8 @@ print("Diagonal matrix D:")
 print(numpy_D)
 print("-" * 50)
 print("Verification: A = P @ D @ P^(-1)")
-print(np.allclose(A, numpy_P @ numpy_D @ numpy_P_inv))
+if structure["symmetric"]:
+    print(np.allclose(A, numpy_P @ numpy_D @ numpy_P.T))
+else:
+    print(np.allclose(A, apply_inverse(numpy_P, numpy_P @ numpy_D, right=True)))
 print("=" * 50)
@@ -1,36 +1,64 @@
 import numpy as np
+from scipy.linalg import lu_factor, lu_solve
 from sympy import Matrix
 from fractions import Fraction
 
-# Define the matrix A as a NumPy array
-A = np.array([[4, 2, 1],
-              [3, 5, 2],
-              [2, 1, 3]])
-
-# Convert NumPy array to SymPy Matrix
-sympy_matrix = Matrix(A)
-
-# Compute the inverse using SymPy
-matrix_inverse = sympy_matrix.inv()
-
-# Convert to NumPy array for decimal display
-numpy_inverse = np.array(matrix_inverse, dtype=np.float64)
-
-# Print the result
-print("-" * 50)
-print("Matrix A:")
-print(A)
-print("-" * 50)
-print("Inverse of A (Decimal):")
-print(numpy_inverse)
-print("-" * 50)
-print("Inverse of A (Fraction):")
-for i in range(matrix_inverse.shape[0]):
-    row = []
-    for j in range(matrix_inverse.shape[1]):
-        element = matrix_inverse[i, j]
-        # Convert to fraction
-        frac = Fraction(str(element)).limit_denominator(1000)
-        row.append(str(frac))
-    print("  [ " + ", ".join(f"{f:>6}" for f in row) + " ]")
-print("=" * 50)
+
+def apply_inverse(A, B, right=False):
+    """
+    Apply the inverse of A to B without forming A^(-1) explicitly.
+    A is LU-factored once and B is solved against the factors.
+
+    Args:
+        A: Square, nonsingular matrix
+        B: Vector or matrix
+        right: If True return B @ A^(-1), otherwise A^(-1) @ B
+
+    Returns:
+        np.ndarray: The result, same shape as B
+    """
+    A = np.asarray(A, dtype=np.float64)
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("Matrix must be square")
+
+    lu_and_piv = lu_factor(A)
+    B = np.asarray(B, dtype=np.float64)
+    if right:
+        # B A^(-1) = (A^(-T) B^T)^T
+        return lu_solve(lu_and_piv, B.T, trans=1).T
+    return lu_solve(lu_and_piv, B)
+
+
+if __name__ == "__main__":
+    # Define the matrix A as a NumPy array
+    A = np.array([[4, 2, 1],
+                  [3, 5, 2],
+                  [2, 1, 3]])
+
+    # Convert NumPy array to SymPy Matrix
+    sympy_matrix = Matrix(A)
+
+    # Compute the inverse using SymPy
+    matrix_inverse = sympy_matrix.inv()
+
+    # Convert to NumPy array for decimal display
+    numpy_inverse = np.array(matrix_inverse, dtype=np.float64)
+
+    # Print the result
+    print("-" * 50)
+    print("Matrix A:")
+    print(A)
+    print("-" * 50)
+    print("Inverse of A (Decimal):")
+    print(numpy_inverse)
+    print("-" * 50)
+    print("Inverse of A (Fraction):")
+    for i in range(matrix_inverse.shape[0]):
+        row = []
+        for j in range(matrix_inverse.shape[1]):
+            element = matrix_inverse[i, j]
+            # Convert to fraction
+            frac = Fraction(str(element)).limit_denominator(1000)
+            row.append(str(frac))
+        print("  [ " + ", ".join(f"{f:>6}" for f in row) + " ]")
+    print("=" * 50)
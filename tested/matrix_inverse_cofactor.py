@@ -1,6 +1,8 @@
 import sympy as sp
 from fractions import Fraction
 
+from matrix_determinant import determinant_bareiss
+
 # Define the matrix A directly as SymPy Matrix
 A = sp.Matrix([
     [1, 2, -1],
@@ -14,8 +16,9 @@ print("=" * 50)
 print("\nMatrix A:")
 print(A)
 
-# Compute determinant
-det_A = A.det()
+# Compute determinant (exact, fraction-free Bareiss on Python ints)
+det_exact = determinant_bareiss(A)
+det_A = sp.Rational(det_exact.numerator, det_exact.denominator)
 print(f"\ndet(A) = {det_A}")
 
 # Get cofactor matrix (adjugate is transpose of cofactor matrix)
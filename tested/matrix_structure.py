@@ -0,0 +1,134 @@
+import numpy as np
+from scipy import linalg
+
+
+def bandwidths(A, tol=0.0):
+    """
+    Lower and upper bandwidth of A: the largest i - j and j - i
+    over all entries with |A[i, j]| > tol.
+    """
+    rows, cols = np.nonzero(np.abs(A) > tol)
+    if rows.size == 0:
+        return 0, 0
+    offsets = rows - cols
+    return max(int(offsets.max()), 0), max(int(-offsets.min()), 0)
+
+
+def is_symmetric(A, rtol=1e-12):
+    """
+    True if A equals A^T up to rtol relative to the largest entry of A
+    (no absolute tolerance, so small-scale matrices are judged on their
+    own scale). Integer matrices are compared exactly.
+    """
+    A = np.asarray(A)
+    if A.shape != A.T.shape:
+        return False
+    if A.size == 0 or A.dtype.kind in "iub":
+        return bool(np.array_equal(A, A.T))
+    return bool(np.abs(A - A.T).max() <= rtol * np.abs(A).max())
+
+
+def detect_structure(A, tol=0.0, band_ratio=0.25):
+    """
+    Detect the structure of a square matrix so it can be sent to a
+    specialized kernel.
+
+    Args:
+        A: Square matrix
+        tol: Entries with magnitude <= tol count as zero
+        band_ratio: A matrix counts as banded when its band
+            (lower + upper + 1) is at most band_ratio * n wide
+
+    Returns:
+        dict with:
+        - 'kind': "diagonal", "upper_triangular", "lower_triangular",
+          "banded", "symmetric" or "general" (most specific first)
+        - 'symmetric': True if A equals A^T (is_symmetric)
+        - 'lower', 'upper': lower and upper bandwidth
+    """
+    A = np.asarray(A)
+    n = A.shape[0]
+    if A.shape != (n, n):
+        raise ValueError("Matrix must be square")
+
+    lower, upper = bandwidths(A, tol)
+    symmetric = is_symmetric(A)
+
+    if lower == 0 and upper == 0:
+        kind = "diagonal"
+    elif lower == 0:
+        kind = "upper_triangular"
+    elif upper == 0:
+        kind = "lower_triangular"
+    elif lower + upper + 1 <= band_ratio * n:
+        kind = "banded"
+    elif symmetric:
+        kind = "symmetric"
+    else:
+        kind = "general"
+
+    return {
+        "kind": kind,
+        "symmetric": symmetric,
+        "lower": lower,
+        "upper": upper,
+    }
+
+
+def solve_structured(A, b, structure=None):
+    """
+    Solve A x = b with the kernel that fits the structure of A:
+    division for diagonal, back/forward substitution for triangular,
+    a banded LU for banded, symmetric LDL^T for symmetric, LU otherwise.
+
+    Args:
+        A: Square matrix
+        b: Right-hand side vector or (n, k) block
+        structure: Result of detect_structure(A), computed if omitted
+
+    Returns:
+        np.ndarray: The solution x
+    """
+    A = np.asarray(A, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    if structure is None:
+        structure = detect_structure(A)
+    kind = structure["kind"]
+
+    if kind == "diagonal":
+        d = np.diagonal(A)
+        return b / (d if b.ndim == 1 else d[:, np.newaxis])
+    if kind in ("upper_triangular", "lower_triangular"):
+        return linalg.solve_triangular(A, b, lower=(kind == "lower_triangular"))
+    if kind == "banded":
+        lower, upper = structure["lower"], structure["upper"]
+        # LAPACK band storage: ab[upper + i - j, j] = A[i, j]
+        n = A.shape[0]
+        ab = np.zeros((lower + upper + 1, n))
+        for offset in range(-upper, lower + 1):
+            ab[upper + offset, max(0, -offset):n - max(0, offset)] = np.diagonal(A, -offset)
+        return linalg.solve_banded((lower, upper), ab, b)
+    if kind == "symmetric":
+        return linalg.solve(A, b, assume_a="sym")
+    return linalg.solve(A, b)
+
+
+def eig_structured(A, structure=None):
+    """
+    Eigenvalues and eigenvectors using the cheapest kernel for A:
+    the diagonal itself for diagonal matrices, eigh (real, orthonormal
+    eigenvectors, O(n^3) with a small constant) for symmetric ones and
+    the general eig otherwise.
+
+    Returns:
+        tuple: (eigenvalues, eigenvectors as columns)
+    """
+    A = np.asarray(A, dtype=np.float64)
+    if structure is None:
+        structure = detect_structure(A)
+
+    if structure["kind"] == "diagonal":
+        return np.diagonal(A).copy(), np.eye(A.shape[0])
+    if structure["symmetric"]:
+        return np.linalg.eigh(A)
+    return np.linalg.eig(A)
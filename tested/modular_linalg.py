@@ -0,0 +1,246 @@
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from math import log2
+
+import numpy as np
+from sympy import prevprime
+
+from exact_rref import integer_rows
+
+# Primes just below 2**31, found on demand: residues stay below 2**31, so
+# products of two fit in int64 and elimination mod p runs on plain NumPy
+_PRIMES = []
+
+# modular_determinant(early_stop=True) stops once the CRT value survives
+# this many more primes
+STABLE_PRIMES = 2
+
+
+def large_primes(count):
+    """The count largest primes below 2**31 (descending)."""
+    while len(_PRIMES) < count:
+        _PRIMES.append(prevprime(_PRIMES[-1] if _PRIMES else 2 ** 31))
+    return _PRIMES[:count]
+
+
+def _integer_matrix(M):
+    """
+    Integer version of M plus the factor it was scaled by: rows with
+    Fractions are multiplied by the lcm of their denominators. The matrix
+    is int64 when every entry fits, else an object array of Python ints.
+    """
+    M = np.asarray(M)
+    if M.ndim != 2:
+        raise ValueError("Input must be a 2D matrix")
+    if M.dtype.kind in "iub":
+        if M.dtype == np.uint64 and M.size and M.max() > np.iinfo(np.int64).max:
+            # astype(np.int64) would wrap these around to negative numbers
+            return M.astype(object), 1
+        return M.astype(np.int64), 1
+
+    rows, scale = integer_rows(M)
+    A = np.array([[int(x) for x in row] for row in rows], dtype=object).reshape(M.shape)
+    try:
+        return A.astype(np.int64), scale
+    except OverflowError:
+        return A, scale
+
+
+def eliminate_mod(A, p, square=False):
+    """
+    Gaussian elimination of an integer matrix modulo a prime p < 2**31.
+
+    Each step is one vectorized int64 rank-1 update of the trailing block
+    followed by a reduction mod p.
+
+    Args:
+        A: int64 (or Python int object) matrix
+        p: Prime modulus
+        square: Stop at the first column without a pivot (det = 0)
+
+    Returns:
+        tuple: (rank mod p, determinant mod p) where the determinant is
+        only meaningful for square input
+    """
+    R = np.asarray(A % p, dtype=np.int64)
+    m, n = R.shape
+    rank = 0
+    det = 1
+
+    for col in range(n):
+        if rank == m:
+            break
+        nonzero = np.flatnonzero(R[rank:, col])
+        if nonzero.size == 0:
+            if square:
+                return rank, 0
+            continue
+
+        pivot_row = rank + nonzero[0]
+        if pivot_row != rank:
+            R[[rank, pivot_row]] = R[[pivot_row, rank]]
+            det = -det
+        pivot = int(R[rank, col])
+        det = det * pivot % p
+
+        # Normalize the pivot row, then eliminate below it
+        R[rank, col + 1:] = R[rank, col + 1:] * pow(pivot, -1, p) % p
+        factors = R[rank + 1:, col, np.newaxis]
+        block = R[rank + 1:, col + 1:]
+        block -= factors * R[rank, col + 1:]
+        np.remainder(block, p, out=block)
+        rank += 1
+
+    return rank, det % p
+
+
+def _map(func, items, workers):
+    """map, on a thread pool when workers > 1 (NumPy releases the GIL)."""
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(func, items))
+    return [func(item) for item in items]
+
+
+def _norm_bits(A, axis):
+    """log2 of the Euclidean norms of the rows (axis=1) or columns (axis=0) of A."""
+    if A.dtype == object:
+        lines = A.tolist() if axis == 1 else A.T.tolist()
+        sums = [sum(x * x for x in line) for line in lines]
+        return np.array([0.5 * log2(s) if s else -np.inf for s in sums])
+    with np.errstate(divide="ignore"):
+        return np.log2(np.linalg.norm(A.astype(np.float64), axis=axis))
+
+
+def minor_bound_bits(A, size):
+    """
+    log2 of a Hadamard bound on every size x size minor of A: the product
+    of the size largest row norms (or column norms, whichever is smaller).
+    -inf when A has fewer than size nonzero rows or columns.
+    """
+    bounds = []
+    for axis in (1, 0):
+        bits = np.sort(_norm_bits(A, axis))[::-1][:size]
+        bounds.append(float(np.sum(bits)) if bits.size == size else -np.inf)
+    return min(bounds)
+
+
+def hadamard_bound_bits(A):
+    """log2 of the Hadamard bound |det(A)| <= prod_i ||row_i||_2."""
+    return float(np.sum(_norm_bits(A, 1)))
+
+
+def modular_rank(M, num_primes=2, workers=1):
+    """
+    Exact rank of an integer or rational matrix from its rank modulo large
+    primes.
+
+    The rank mod p never exceeds the true rank, and is lower only when p
+    divides every (r+1) x (r+1) minor. So r, the largest rank over the
+    primes so far, is the rank once the product of those primes exceeds
+    the Hadamard bound of the (r+1)-minors (minor_bound_bits): a nonzero
+    minor cannot be divisible by a larger number. Primes are added until
+    that holds. Full rank modulo one prime is always exact.
+
+    Args:
+        M: Matrix of ints / Fractions
+        num_primes: Number of primes to try in the first round
+        workers: Threads to run the primes on
+
+    Returns:
+        int: The rank
+    """
+    A, _ = _integer_matrix(M)
+    full = min(A.shape)
+
+    # Full rank modulo one prime is already the exact rank
+    rank = eliminate_mod(A, large_primes(1)[0])[0]
+    if rank == full:
+        return rank
+    bits = log2(large_primes(1)[0])
+
+    count = 1
+    batch = max(1, num_primes - 1)
+    while rank < full:
+        # +1 bit of slack for the floating-point logarithms
+        if bits > minor_bound_bits(A, rank + 1) + 1:
+            break
+        primes = large_primes(count + batch)[count:]
+        count += batch
+        rank = max([rank] + _map(lambda p: eliminate_mod(A, p)[0], primes, workers))
+        bits += sum(log2(p) for p in primes)
+        batch = max(1, workers)
+    return rank
+
+
+def crt(residues, primes):
+    """
+    Combine residues r_i mod p_i into the unique x with |x| < prod(p_i) / 2
+    (Chinese Remainder Theorem, Garner's incremental form).
+    """
+    x, modulus = 0, 1
+    for r, p in zip(residues, primes):
+        t = (r - x) * pow(modulus % p, -1, p) % p
+        x += modulus * t
+        modulus *= p
+    return x - modulus if 2 * x > modulus else x
+
+
+def modular_determinant(M, workers=1, early_stop=False):
+    """
+    Exact determinant of an integer or rational matrix by multi-prime
+    modular elimination.
+
+    The determinant is computed modulo 31-bit primes and reconstructed
+    with the CRT. Intermediate numbers never grow, and the primes are
+    independent, so they can run in parallel. The primes are taken until
+    their product exceeds twice the Hadamard bound, which makes the
+    result exact. That bound is often far too pessimistic; early_stop
+    ends the loop once the CRT value has stayed the same for
+    STABLE_PRIMES more primes instead. This is only a heuristic: any
+    determinant congruent to a smaller value modulo the product of the
+    primes used, e.g. a multiple of it, comes back wrong.
+
+    Args:
+        M: Square matrix of ints / Fractions
+        workers: Threads to run the primes on
+        early_stop: Stop before the Hadamard bound once the CRT value is
+            stable (faster, not guaranteed exact)
+
+    Returns:
+        int or Fraction: The exact determinant
+    """
+    A, scale = _integer_matrix(M)
+    n = A.shape[0]
+    if A.shape != (n, n):
+        raise ValueError("Matrix must be square")
+    if n == 0:
+        return 1
+    if not np.all(np.any(A != 0, axis=1)):
+        return 0
+
+    # Enough primes for prod(p) > 2 * Hadamard bound (plus a bit of slack
+    # for the floating-point logarithms)
+    bits = hadamard_bound_bits(A) + 2
+    count = 0
+    while bits > 0:
+        count += 1
+        bits -= log2(large_primes(count)[-1])
+    primes = large_primes(count)
+
+    residues = []
+    det = None
+    stable = 0
+    for start in range(0, count, workers):
+        batch = primes[start:start + workers]
+        for r in _map(lambda p: eliminate_mod(A, p, square=True)[1], batch, workers):
+            residues.append(r)
+            previous, det = det, crt(residues, primes)
+            stable = stable + 1 if det == previous else 0
+        if early_stop and stable >= STABLE_PRIMES:
+            break
+
+    if scale == 1:
+        return det
+    det = Fraction(det, scale)
+    return det.numerator if det.denominator == 1 else det
@@ -0,0 +1,145 @@
+import numpy as np
+from dot_product_vector import classify_by_dot
+
+METRICS = ("euclidean", "cosine", "angle", "classify")
+
+# float64 arrays of the tile's shape alive at once in _metric_tile
+# (the GEMM result plus the metric's intermediates)
+TILE_TEMPORARIES = 4
+
+
+def _as_rows(X):
+    X = np.asarray(X, dtype=np.float64)
+    if X.ndim != 2:
+        raise ValueError("Input must be a 2D array with one vector per row")
+    return X
+
+
+def _metric_tile(X_tile, Y, x_sq, y_sq, metric, rtol):
+    """One tile of the pairwise matrix from a single GEMM X_tile @ Y^T."""
+    dots = X_tile @ Y.T
+
+    if metric == "euclidean":
+        # ||a - b||^2 = ||a||^2 + ||b||^2 - 2 a·b, clipped against round-off
+        sq = x_sq[:, np.newaxis] + y_sq[np.newaxis, :] - 2.0 * dots
+        return np.sqrt(np.maximum(sq, 0.0, out=sq), out=sq)
+
+    if metric == "classify":
+        return classify_by_dot(dots, np.sqrt(x_sq)[:, np.newaxis],
+                               np.sqrt(y_sq)[np.newaxis, :], rtol)
+
+    norms = np.sqrt(x_sq)[:, np.newaxis] * np.sqrt(y_sq)[np.newaxis, :]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cos_theta = np.where(norms > 0, dots / norms, np.nan)
+    if metric == "cosine":
+        return cos_theta
+    # Numerical safety
+    return np.degrees(np.arccos(np.clip(cos_theta, -1.0, 1.0)))
+
+
+def _tile_rows(M, block_bytes):
+    """Rows of X per tile so the temporaries of one tile fit in block_bytes."""
+    return max(1, block_bytes // (max(M, 1) * 8 * TILE_TEMPORARIES))
+
+
+def pairwise_tiles(X, Y=None, metric="euclidean", tile_rows=None,
+                   dtype=np.float64, rtol=1e-12, block_bytes=64 * 2**20):
+    """
+    Compute a pairwise matrix between the rows of X and Y tile by tile.
+
+    Each tile covers tile_rows rows of X against all of Y and comes from
+    one GEMM, so only a (tile_rows, len(Y)) block is in memory at a time.
+    By default tile_rows follows from block_bytes and len(Y): with 100k
+    vectors in Y a 64 MiB budget gives tiles of 20 rows.
+
+    Args:
+        X: Vectors as rows, shape (N, d)
+        Y: Vectors as rows, shape (M, d). Defaults to X.
+        metric: "euclidean" (distance), "cosine" (similarity), "angle"
+            (degrees, NaN for zero vectors) or "classify" (int8 codes
+            1 acute / 0 right / -1 obtuse)
+        tile_rows: Rows of X per tile. Defaults to what fits in block_bytes.
+        dtype: Output dtype for float metrics, e.g. np.float32
+        rtol: Relative tolerance for "classify"
+        block_bytes: Memory budget for one tile and its temporaries
+
+    Yields:
+        tuple: (start, tile) where tile holds rows start:start+len(tile)
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric: {metric!r}")
+    X = _as_rows(X)
+    Y = X if Y is None else _as_rows(Y)
+    if X.shape[1] != Y.shape[1]:
+        raise ValueError("Vectors in X and Y must have the same length")
+
+    x_sq = np.einsum("ij,ij->i", X, X)
+    y_sq = x_sq if Y is X else np.einsum("ij,ij->i", Y, Y)
+    if tile_rows is None:
+        tile_rows = _tile_rows(Y.shape[0], block_bytes)
+
+    for start in range(0, X.shape[0], tile_rows):
+        stop = min(start + tile_rows, X.shape[0])
+        tile = _metric_tile(X[start:stop], Y, x_sq[start:stop], y_sq, metric, rtol)
+        if metric != "classify":
+            tile = tile.astype(dtype, copy=False)
+        yield start, tile
+
+
+def pairwise(X, Y=None, metric="euclidean", tile_rows=None, dtype=np.float64, rtol=1e-12,
+             block_bytes=64 * 2**20):
+    """
+    Full (N, M) pairwise matrix assembled from pairwise_tiles.
+    For very large N * M iterate over pairwise_tiles instead.
+    """
+    tiles = [tile for _, tile in pairwise_tiles(X, Y, metric, tile_rows, dtype, rtol, block_bytes)]
+    if not tiles:
+        M = len(X) if Y is None else len(Y)
+        return np.empty((0, M), dtype=np.int8 if metric == "classify" else dtype)
+    return np.vstack(tiles)
+
+
+def top_k_nearest(X, Y=None, k=1, metric="euclidean", tile_rows=None, exclude_self=None,
+                  block_bytes=64 * 2**20):
+    """
+    Indices and values of the k nearest rows of Y for every row of X,
+    selected tile by tile with argpartition (the full matrix is never built).
+
+    Args:
+        metric: "euclidean" (smallest distance) or "cosine" (largest similarity)
+        exclude_self: Skip i == j matches (X[i] against Y[i]); defaults to
+            True when Y is None
+        tile_rows, block_bytes: Tiling, as for pairwise_tiles
+
+    Returns:
+        tuple: (indices, values), both shape (N, k), best first
+    """
+    if metric not in ("euclidean", "cosine"):
+        raise ValueError("top_k_nearest supports the 'euclidean' and 'cosine' metrics")
+    if exclude_self is None:
+        exclude_self = Y is None
+
+    M = len(X) if Y is None else len(Y)
+    if not 0 < k <= M - int(exclude_self):
+        raise ValueError("k must be between 1 and the number of candidates")
+
+    indices = np.empty((len(X), k), dtype=np.intp)
+    values = np.empty((len(X), k))
+    for start, tile in pairwise_tiles(X, Y, metric, tile_rows, block_bytes=block_bytes):
+        # Turn the tile into a "smaller is nearer" score
+        score = tile if metric == "euclidean" else -np.nan_to_num(tile, nan=-np.inf)
+        if exclude_self:
+            # Row i of X matches column i of Y; rows past the end of Y have none
+            rows = np.arange(min(tile.shape[0], M - start))
+            score[rows, start + rows] = np.inf
+
+        best = np.argpartition(score, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(score, best, axis=1), axis=1)
+        best = np.take_along_axis(best, order, axis=1)
+
+        stop = start + tile.shape[0]
+        indices[start:stop] = best
+        values[start:stop] = np.take_along_axis(tile, best, axis=1)
+
+    return indices, values
@@ -1,16 +1,27 @@
 import numpy as np
+from scipy import sparse
 from sympy import Matrix
 
+from modular_linalg import modular_rank
+from sparse_systems import sparse_rank
+
 # Define the matrix A as a NumPy array
 A = np.array([[0, 1],
               [0, 0],
               [0, 0]])
 
-# Convert NumPy array to SymPy Matrix
-sympy_matrix = Matrix(A)
+if sparse.issparse(A):
+    # Sparse input: sparse elimination, never densified
+    rank = sparse_rank(A)
+elif A.dtype.kind in "iub":
+    # Integer input: exact rank modulo large primes, no coefficient growth
+    rank = modular_rank(A)
+else:
+    # Convert NumPy array to SymPy Matrix
+    sympy_matrix = Matrix(A)
 
-# Compute the rank using SymPy
-rank = sympy_matrix.rank()
+    # Compute the rank using SymPy
+    rank = sympy_matrix.rank()
 
 # Print the result
 print("-" * 50)
@@ -2,6 +2,8 @@
 import numpy as np
 from sympy import Matrix
 
+from float_rref import rref_float
+
 # Define the matrix A as a NumPy array
 A = np.array([[2, 3, 4],
               [2, 3, 4],
@@ -9,10 +11,13 @@ A = np.array([[2, 3, 4],
 
 
 # Compute the RREF
-sympy_matrix_pre_rref = Matrix(A)                                   # 1. Convert NumPy array to SymPy Matrix
-matrix_post_rref = sympy_matrix_pre_rref.rref()                     # 2. Compute RREF using SymPy  
-rref_matrix = matrix_post_rref[0]                                   # 3. Extract the RREF matrix
-numpy_rref_matrix = np.array(rref_matrix, dtype=np.float64)         # 4. Convert back to NumPy array
+if np.issubdtype(A.dtype, np.floating):
+    numpy_rref_matrix, pivot_cols = rref_float(A)                   # Float input: NumPy RREF with partial pivoting
+else:
+    sympy_matrix_pre_rref = Matrix(A)                               # 1. Convert NumPy array to SymPy Matrix
+    matrix_post_rref = sympy_matrix_pre_rref.rref()                 # 2. Compute exact RREF using SymPy  
+    rref_matrix = matrix_post_rref[0]                               # 3. Extract the RREF matrix
+    numpy_rref_matrix = np.array(rref_matrix, dtype=np.float64)     # 4. Convert back to NumPy array
 
 # Print the RREF matrix
 print("-" * 50)
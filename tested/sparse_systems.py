@@ -0,0 +1,252 @@
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import maximum_bipartite_matching, structural_rank
+from scipy.sparse.linalg import splu
+
+# Round-off in sparse elimination grows with the number of steps a fill
+# entry goes through; residues of dependent columns stay below
+# 100 * max(m, n) * eps * max|column| in practice
+SAFETY_FACTOR = 100
+
+
+def _sparse_tolerance(A):
+    """
+    Default zero tolerance per column: max(m, n) * eps * max|column|, as for
+    dense matrices, times SAFETY_FACTOR for the round-off that builds up
+    over many sparse elimination steps.
+    """
+    if A.shape[0] == 0:
+        return np.zeros(A.shape[1])
+    scale = abs(A).max(axis=0).toarray().ravel()
+    return SAFETY_FACTOR * max(A.shape) * np.finfo(np.float64).eps * scale
+
+
+def _column_tolerances(A, tol):
+    """tol (None, a scalar or one value per column) as a list per column."""
+    if tol is None:
+        tol = _sparse_tolerance(A)
+    return np.broadcast_to(np.asarray(tol, dtype=np.float64), (A.shape[1],)).tolist()
+
+
+def _to_rows(A):
+    """Split a sparse matrix into one {col: value} dict per row."""
+    A = sparse.csr_matrix(A, dtype=np.float64)
+    A.sum_duplicates()
+    rows = []
+    for i in range(A.shape[0]):
+        start, end = A.indptr[i], A.indptr[i + 1]
+        rows.append(dict(zip(A.indices[start:end].tolist(), A.data[start:end].tolist())))
+    return rows
+
+
+def _forward_eliminate(rows, num_cols, tol):
+    """
+    Sparse Gaussian elimination, column by column, on {col: value} rows.
+
+    Pivots are chosen by threshold partial pivoting: among the rows whose
+    entry is at least 0.5 * the largest one in the column, take the row with
+    the fewest nonzeros to limit fill-in (a looser 0.1 let round-off grow
+    until residues of dependent columns passed the tolerance). Only rows
+    that actually contain the column are touched, found through a
+    column -> rows index.
+
+    Returns:
+        list of (pivot_col, row_id) pairs in column order
+    """
+    col_index = [set() for _ in range(num_cols)]
+    for i, row in enumerate(rows):
+        for j in row:
+            col_index[j].add(i)
+
+    pivots = []
+    for col in range(num_cols):
+        candidates = [i for i in col_index[col] if abs(rows[i][col]) > tol[col]]
+        if not candidates:
+            # Free column: drop round-off entries below the tolerance
+            for i in col_index[col]:
+                del rows[i][col]
+            col_index[col].clear()
+            continue
+
+        largest = max(abs(rows[i][col]) for i in candidates)
+        p = min((i for i in candidates if abs(rows[i][col]) >= 0.5 * largest),
+                key=lambda i: (len(rows[i]), i))
+        pivot_row = rows[p]
+        pivot_value = pivot_row[col]
+
+        # The pivot row leaves the active part of the matrix
+        for j in pivot_row:
+            col_index[j].discard(p)
+
+        for i in list(col_index[col]):
+            row = rows[i]
+            factor = row.pop(col) / pivot_value
+            col_index[col].discard(i)
+            for j, value in pivot_row.items():
+                if j == col:
+                    continue
+                new = row.get(j, 0.0) - factor * value
+                if abs(new) > tol[j]:
+                    if j not in row:
+                        col_index[j].add(i)
+                    row[j] = new
+                elif j in row:
+                    del row[j]
+                    col_index[j].discard(i)
+
+        pivots.append((col, p))
+
+    return pivots
+
+
+def _full_rank_lu(A, tol):
+    """
+    SuperLU factorization of a square matrix with a COLAMD fill-reducing
+    column ordering, or None unless every pivot clears the tolerance of
+    its column. LU is not rank revealing, so only the full-rank answer
+    can be taken from it; anything else goes to _forward_eliminate.
+    Structurally singular matrices (no perfect matching of rows and
+    columns) are never handed to SuperLU, whose dense kernels reject
+    their empty blocks with LAPACK errors on stderr.
+    """
+    if structural_rank(sparse.csr_matrix(A)) < A.shape[1]:
+        return None
+    try:
+        lu = splu(sparse.csc_matrix(A), permc_spec="COLAMD", options={"Equil": False})
+    except RuntimeError:
+        # Exactly singular
+        return None
+    # Column j of A is column perm_c[j] of L @ U
+    if np.all(np.abs(lu.U.diagonal()[lu.perm_c]) > np.asarray(tol)):
+        return lu
+    return None
+
+
+def sparse_rank(A, tol=None):
+    """
+    Rank of a scipy.sparse matrix (never densified).
+
+    The structural rank s (largest matching of rows to columns through
+    nonzeros) bounds the rank from above. The s x s block of a maximum
+    matching is factored by SuperLU with a COLAMD ordering; when all its
+    pivots are clearly nonzero the rank is exactly s. Only matrices that
+    are numerically rank deficient beyond their structure (e.g. equal or
+    dependent rows) fall back to sparse elimination in column order on
+    Python dicts. Its fill-in and run time depend on the sparsity
+    pattern: banded and tree-like matrices stay cheap, random patterns
+    with thousands of columns fill in heavily and can take minutes.
+    tol is as for sparse_rref.
+    """
+    A = sparse.csr_matrix(A, dtype=np.float64)
+    m, n = A.shape
+    tol = _column_tolerances(A, tol)
+    if A.nnz == 0:
+        return 0
+
+    s = int(structural_rank(A))
+    match = maximum_bipartite_matching(A, perm_type="column")
+    rows = np.flatnonzero(match >= 0)
+    cols = match[rows]
+    if _full_rank_lu(A[rows][:, cols], [tol[j] for j in cols]) is not None:
+        return s
+    return min(s, len(_forward_eliminate(_to_rows(A), n, tol)))
+
+
+def sparse_rref(A, tol=None):
+    """
+    Compute the RREF of a scipy.sparse matrix without densifying it.
+
+    When the leading m x m block is nonsingular (e.g. [A | b] with A
+    square and invertible), the RREF is [I | A11^-1 A12] and comes from
+    one SuperLU factorization (see _full_rank_lu). Otherwise forward
+    elimination gives the pivots; the pivot rows are then scaled and
+    reduced upwards from the last pivot, so memory stays O(nnz + fill).
+    Fill-in depends on the sparsity pattern: banded and tree-like
+    matrices stay sparse, random patterns fill in heavily.
+
+    Args:
+        A: scipy.sparse matrix of shape (m, n)
+        tol: Entries with magnitude <= tol count as zero; a scalar or one
+            value per column. Defaults to _sparse_tolerance (per column).
+
+    Returns:
+        tuple: (rref_matrix, pivot_cols) with rref_matrix as a CSR matrix
+        and pivot_cols as a tuple of ints, like SymPy's rref()
+    """
+    A = sparse.csr_matrix(A, dtype=np.float64)
+    m, n = A.shape
+    tol = _column_tolerances(A, tol)
+
+    lu = _full_rank_lu(A[:, :m], tol[:m]) if 0 < m <= n else None
+    if lu is not None:
+        rest = lu.solve(A[:, m:].toarray()) if n > m else np.empty((m, 0))
+        rest[np.abs(rest) <= np.asarray(tol[m:])] = 0.0
+        rref_matrix = sparse.hstack([sparse.identity(m), sparse.csr_matrix(rest)], format="csr")
+        return rref_matrix, tuple(range(m))
+
+    rows = _to_rows(A)
+    pivots = _forward_eliminate(rows, n, tol)
+
+    # Column -> pivot rows index for the backward (upward) pass
+    col_index = {}
+    for _, p in pivots:
+        for j in rows[p]:
+            col_index.setdefault(j, set()).add(p)
+
+    for col, p in reversed(pivots):
+        pivot_row = rows[p]
+        scale = pivot_row[col]
+        for j in pivot_row:
+            pivot_row[j] /= scale
+        pivot_row[col] = 1.0
+
+        for i in col_index.get(col, ()):
+            if i == p:
+                continue
+            row = rows[i]
+            factor = row.pop(col)
+            for j, value in pivot_row.items():
+                if j == col:
+                    continue
+                new = row.get(j, 0.0) - factor * value
+                if abs(new) > tol[j]:
+                    if j not in row:
+                        col_index.setdefault(j, set()).add(i)
+                    row[j] = new
+                elif j in row:
+                    del row[j]
+                    col_index[j].discard(i)
+        col_index[col] = {p}
+
+    # Assemble pivot rows in order; the remaining rows are zero
+    indptr = [0]
+    indices = []
+    data = []
+    for _, p in pivots:
+        row = sorted(rows[p].items())
+        indices.extend(j for j, _ in row)
+        data.extend(v for _, v in row)
+        indptr.append(len(indices))
+    indptr.extend([len(indices)] * (m - len(pivots)))
+
+    rref_matrix = sparse.csr_matrix((data, indices, indptr), shape=(m, n))
+    return rref_matrix, tuple(col for col, _ in pivots)
+
+
+if __name__ == "__main__":
+    # Regression check: rank-4 matrix whose round-off residues the old
+    # 0.1 threshold pivoting and tight tolerance took for a 5th pivot
+    A = sparse.csr_matrix(np.array([[4, 6, 7, 6, 2, -1],
+                                    [-2, -4, 7, -8, 10, 1],
+                                    [-3, 4, -6, 7, 14, -10],
+                                    [2, 9, 6, 10, 15, -8],
+                                    [-9, -8, -6, -11, 2, 2]], dtype=np.float64))
+
+    rref_matrix, pivot_cols = sparse_rref(A)
+    print("-" * 50)
+    print("RREF:")
+    print(rref_matrix.toarray())
+    print("Pivot columns:", pivot_cols)
+    assert pivot_cols == (0, 1, 2, 3), pivot_cols
+    assert sparse_rank(A) == 4
+    print("=" * 50)
@@ -1,98 +1,367 @@
 from sympy import Matrix, symbols
 from fractions import Fraction
+from functools import lru_cache
+import json
+import sys
 import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import lsqr
+
+from exact_rref import rref_exact
+from float_rref import rref_float, rref_stack
+from sparse_systems import sparse_rank, sparse_rref
+
+
+# Number of rendered matrices kept by format_matrix
+RENDER_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=4096)
+def _fraction_string(x, max_denom):
+    """Fraction string of a float, memoized since the same values repeat."""
+    return str(Fraction(str(x)).limit_denominator(max_denom))
 
 
 def to_fraction(val, max_denom=1000):
     """Convert a number to fraction form"""
     try:
-        frac = Fraction(str(float(val))).limit_denominator(max_denom)
-        return str(frac)
+        return _fraction_string(float(val), max_denom)
     except:
         return str(val)
 
 
-def format_matrix(matrix, as_fractions=True, col_width=8):
+def rational_approximation(values, max_denom=1000):
     """
-    Format a SymPy matrix for nice printing.
-    
+    Best rational approximations p/q with q <= max_denom of a float array,
+    the same as Fraction.limit_denominator applied to every entry.
+
+    The continued-fraction expansions of all entries run in lockstep on
+    NumPy arrays; an entry drops out once its expansion terminates or the
+    next convergent's denominator would exceed max_denom.
+
     Args:
-        matrix: SymPy Matrix object
-        as_fractions: If True, convert values to fractions
-        col_width: Width of each column
-    
+        values: Array of finite floats with |value| < 2**53
+        max_denom: Largest allowed denominator
+
     Returns:
-        str: Formatted matrix string
+        tuple: (p, q) int64 arrays with the shape of values, q > 0
     """
-    rows = matrix.rows
-    cols = matrix.cols
-    
-    # Convert matrix to list of lists with formatted strings
-    formatted_rows = []
-    for i in range(rows):
-        row = []
-        for j in range(cols):
-            val = matrix[i, j]
-            if as_fractions:
-                cell_str = to_fraction(val)
-            else:
-                try:
-                    cell_str = f"{float(val):.6g}"
-                except:
-                    cell_str = str(val)
-            row.append(cell_str)
-        formatted_rows.append(row)
-    
-    # Calculate column widths
-    col_widths = []
-    for j in range(cols):
-        max_width = max(len(formatted_rows[i][j]) for i in range(rows))
-        col_widths.append(max(max_width, col_width))
-    
+    x = np.asarray(values, dtype=np.float64)
+    shape = x.shape
+    x = x.ravel()
+
+    # Convergents p0/q0 (previous) and p1/q1 (current)
+    p0 = np.zeros(x.size, dtype=np.int64)
+    q0 = np.ones(x.size, dtype=np.int64)
+    p1 = np.ones(x.size, dtype=np.int64)
+    q1 = np.zeros(x.size, dtype=np.int64)
+
+    active = np.arange(x.size)
+    remainder = x.copy()
+    while active.size:
+        a = np.floor(remainder)
+        # After the first term q1 >= 1, so capping a keeps the q2 test exact
+        a = np.where(q1[active] > 0, np.minimum(a, max_denom + 1), a)
+        a_int = a.astype(np.int64)
+        q2 = q0[active] + a_int * q1[active]
+
+        ok = q2 <= max_denom
+        i = active[ok]
+        p0[i], q0[i], p1[i], q1[i] = p1[i], q1[i], p0[i] + a_int[ok] * p1[i], q2[ok]
+
+        rest = remainder[ok] - a[ok]
+        more = rest != 0
+        active = i[more]
+        with np.errstate(over="ignore"):
+            remainder = 1.0 / rest[more]
+
+    # Best semiconvergent below the bound versus the last convergent
+    k = (max_denom - q0) // q1
+    p_semi = p0 + k * p1
+    q_semi = q0 + k * q1
+    use_last = np.abs(p1 / q1 - x) <= np.abs(p_semi / q_semi - x)
+    p = np.where(use_last, p1, p_semi)
+    q = np.where(use_last, q1, q_semi)
+    return p.reshape(shape), q.reshape(shape)
+
+
+def to_fractions(values, max_denom=1000):
+    """
+    Vectorized to_fraction: fraction strings for a whole float array.
+
+    Each distinct value is approximated once (np.unique), so matrices full
+    of repeated entries such as 0 and 1 cost little. Non-finite and huge
+    entries fall back to to_fraction.
+
+    Returns:
+        np.ndarray: Strings with the shape of values
+    """
+    x = np.asarray(values, dtype=np.float64)
+    out = np.empty(x.shape, dtype=object)
+
+    regular = np.isfinite(x) & (np.abs(x) < 2.0 ** 53)
+    unique, inverse = np.unique(x[regular], return_inverse=True)
+    p, q = rational_approximation(unique, max_denom)
+    strings = np.array([str(pi) if qi == 1 else f"{pi}/{qi}"
+                        for pi, qi in zip(p.tolist(), q.tolist())], dtype=object)
+    out[regular] = strings[inverse.ravel()]
+    for index in zip(*np.nonzero(~regular)):
+        out[index] = to_fraction(x[index], max_denom)
+    return out.astype(str)
+
+
+def _matrix_key(matrix):
+    """Hashable content of a matrix: float64 bytes, or the entries if symbolic."""
+    try:
+        return np.ascontiguousarray(matrix, dtype=np.float64).tobytes()
+    except (TypeError, ValueError):
+        rows, cols = matrix.shape
+        return tuple(matrix[i, j] for i in range(rows) for j in range(cols))
+
+
+def _cells(key, rows, cols, as_fractions):
+    """Cell strings, shape (rows, cols), of a matrix given by _matrix_key."""
+    if isinstance(key, bytes):
+        values = np.frombuffer(key, dtype=np.float64).reshape(rows, cols)
+        if as_fractions:
+            return to_fractions(values)
+        return np.char.mod("%.6g", values)
+
+    cells = []
+    for val in key:
+        if as_fractions:
+            cell_str = to_fraction(val)
+        else:
+            try:
+                cell_str = f"{float(val):.6g}"
+            except:
+                cell_str = str(val)
+        cells.append(cell_str)
+    return np.array(cells, dtype=str).reshape(rows, cols)
+
+
+def _elide(n, limit):
+    """
+    Indices kept when n rows (or columns) are shown at most limit at a time:
+    the first and last halves. Returns (indices, gap) where gap is the
+    position of the ellipsis, or None if nothing is elided.
+    """
+    if limit is None or n <= limit:
+        return np.arange(n), None
+    head = (limit + 1) // 2
+    return np.concatenate([np.arange(head), np.arange(n - limit // 2, n)]), head
+
+
+def _submatrix(matrix, row_idx, col_idx):
+    """matrix[row_idx][:, col_idx] for SymPy, NumPy and scipy.sparse input."""
+    if sparse.issparse(matrix):
+        return sparse.csr_matrix(matrix)[row_idx][:, col_idx].toarray()
+    if isinstance(matrix, Matrix):
+        return matrix.extract(row_idx.tolist(), col_idx.tolist())
+    return np.asarray(matrix)[np.ix_(row_idx, col_idx)]
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _render(key, rows, cols, as_fractions, col_width, row_gap, col_gap):
+    """Render a matrix given by _matrix_key, with optional ellipses (cached)."""
+    cells = _cells(key, rows, cols, as_fractions)
+    if col_gap is not None:
+        cells = np.insert(cells, col_gap, "…", axis=1)
+    if row_gap is not None:
+        cells = np.insert(cells, row_gap, "⋮", axis=0)
+        if col_gap is not None:
+            cells[row_gap, col_gap] = "⋱"
+    rows = cells.shape[0]
+
+    # Calculate column widths and right-align every column at once
+    col_widths = np.maximum(np.char.str_len(cells).max(axis=0), col_width)
+    cells = np.char.rjust(cells, col_widths)
+
     # Build matrix string
     lines = []
-    for i, row in enumerate(formatted_rows):
+    for i, row in enumerate(cells.tolist()):
         # Left bracket
         left = "⎡ " if i == 0 else "⎢ " if i < rows - 1 else "⎣ "
-        
-        # Cells
-        cells = []
-        for j, val in enumerate(row):
-            cells.append(val.rjust(col_widths[j]))
-        
+
         # Right bracket
         right = " ⎤" if i == 0 else " ⎥" if i < rows - 1 else " ⎦"
-        
-        lines.append(left + "  ".join(cells) + right)
-    
+
+        lines.append(left + "  ".join(row) + right)
+
     return "\n".join(lines)
 
 
-def solve_linear_system(A, b):
+def format_matrix(matrix, as_fractions=True, col_width=8, max_rows=None, max_cols=None):
+    """
+    Format a SymPy matrix (or 2D NumPy array) for nice printing.
+    
+    Numeric matrices are converted to fractions in one vectorized pass, and
+    the last RENDER_CACHE_SIZE rendered matrices are cached by content, so
+    printing the same matrix again costs only a lookup.
+    
+    Args:
+        matrix: SymPy Matrix object or 2D NumPy array
+        as_fractions: If True, convert values to fractions
+        col_width: Width of each column
+        max_rows: Show at most this many rows (first and last ones),
+            eliding the middle with ⋮; None shows all rows
+        max_cols: The same for columns, elided with …
+    
+    Returns:
+        str: Formatted matrix string
+    """
+    rows, cols = matrix.shape
+    row_idx, row_gap = _elide(rows, max_rows)
+    col_idx, col_gap = _elide(cols, max_cols)
+    if row_gap is not None or col_gap is not None:
+        matrix = _submatrix(matrix, row_idx, col_idx)
+    elif sparse.issparse(matrix):
+        matrix = matrix.toarray()
+
+    rows, cols = matrix.shape
+    if rows == 0 or cols == 0:
+        return ""
+    return _render(_matrix_key(matrix), rows, cols, as_fractions, col_width, row_gap, col_gap)
+
+
+def least_squares_solve(A, b, weights=None, rcond=None):
+    """
+    Minimum-norm least-squares solution of A x ≈ b.
+    
+    Dense input uses the SVD, so rank-deficient systems get the
+    minimum-norm solution; singular values below rcond * max(s) are
+    dropped. Stacked input (k, m, n) / (k, m) is solved in one call.
+    scipy.sparse input uses LSQR.
+    
+    Args:
+        A: Coefficient matrix (m, n), stack (k, m, n) or scipy.sparse
+        b: Right-hand side (m,) or stack (k, m)
+        weights: Optional nonnegative row weights (m,) or (k, m) for
+            weighted least squares: minimize Σ w_i (A x - b)_i^2
+        rcond: Relative singular value cutoff, default max(m, n) * eps
+    
+    Returns:
+        dict with 'solution', 'residual_norm' (weighted, if weights are
+        given) and 'rank' (effective rank); arrays over k for stacks
+    """
+    b = np.asarray(b, dtype=np.float64)
+    sqrt_w = None if weights is None else np.sqrt(np.asarray(weights, dtype=np.float64))
+    
+    if sparse.issparse(A):
+        A = sparse.csr_matrix(A, dtype=np.float64)
+        if sqrt_w is not None:
+            A = sparse.diags(sqrt_w) @ A
+            b = b * sqrt_w
+        solution = lsqr(A, b, atol=0.0, btol=0.0)[0]
+        return {
+            "solution": solution,
+            "residual_norm": float(np.linalg.norm(A @ solution - b)),
+            "rank": sparse_rank(A),
+        }
+    
+    A = np.asarray(A, dtype=np.float64)
+    single = A.ndim == 2
+    if single:
+        A, b = A[np.newaxis], b[np.newaxis]
+        if sqrt_w is not None:
+            sqrt_w = sqrt_w.reshape(1, -1)
+    if sqrt_w is not None:
+        A = A * sqrt_w[..., np.newaxis]
+        b = b * sqrt_w
+    
+    m, n = A.shape[-2:]
+    if rcond is None:
+        rcond = max(m, n) * np.finfo(np.float64).eps
+    
+    # x = V diag(1/s) U^T b over the singular values above the cutoff
+    U, sing, Vh = np.linalg.svd(A, full_matrices=False)
+    keep = sing > rcond * sing[:, :1]
+    sing_inv = np.divide(1.0, sing, out=np.zeros_like(sing), where=keep)
+    coefficients = sing_inv * np.einsum("kmr,km->kr", U, b)
+    solution = np.einsum("krn,kr->kn", Vh, coefficients)
+    residual_norm = np.linalg.norm(np.einsum("kmn,kn->km", A, solution) - b, axis=1)
+    rank = keep.sum(axis=1)
+    
+    if single:
+        return {
+            "solution": solution[0],
+            "residual_norm": float(residual_norm[0]),
+            "rank": int(rank[0]),
+        }
+    return {"solution": solution, "residual_norm": residual_norm, "rank": rank}
+
+
+def solve_linear_system(A, b, method="auto", tol=None, least_squares=False, weights=None):
     """
     Solve linear system Ax = b comprehensively.
     
     Args:
         A (list[list]): Coefficient matrix
         b (list): Right-hand side vector
+        method (str): "exact" (SymPy), "rational" (exact fraction-free
+            elimination on Python ints, for int / Fraction entries; the
+            matrices come back as SymPy Matrix objects, as for "exact"),
+            "float" (NumPy RREF with partial pivoting), "sparse"
+            (scipy.sparse elimination, never densified) or "auto" (sparse
+            for scipy.sparse A, float if A or b holds floats, rational if
+            both are integer arrays, else exact)
+        tol (float): Rank tolerance for the float and sparse methods. By
+            default the columns of A and the column b are each judged on
+            their own scale
+        least_squares (bool): Also compute the minimum-norm least-squares
+            solution (stored under 'least_squares', see least_squares_solve)
+        weights: Row weights for weighted least squares
     
     Returns:
         dict: Complete solution information
     """
-    # Convert to SymPy
-    A_coeff = Matrix(A)
-    b_vec = Matrix(b)
-    augmented = A_coeff.row_join(b_vec)
+    if method == "auto":
+        if sparse.issparse(A):
+            method = "sparse"
+        else:
+            kinds = [np.asarray(x).dtype.kind for x in (A, b)]
+            if "f" in kinds:
+                method = "float"
+            elif all(kind in "iub" for kind in kinds):
+                method = "rational"
+            else:
+                method = "exact"
+    
+    if method == "sparse":
+        b = np.asarray(b.toarray() if sparse.issparse(b) else b, dtype=np.float64).ravel()
+        A_coeff = sparse.csr_matrix(A, dtype=np.float64)
+        b_vec = sparse.csr_matrix(b.reshape(-1, 1))
+        augmented = sparse.hstack([A_coeff, b_vec], format="csr")
+    elif method == "float":
+        A_coeff = np.asarray(A, dtype=np.float64)
+        b_vec = np.asarray(b, dtype=np.float64).reshape(-1, 1)
+        augmented = np.hstack([A_coeff, b_vec])
+    elif method in ("rational", "exact"):
+        # Convert to SymPy (both exact methods return SymPy matrices)
+        A_coeff = Matrix(A)
+        b_vec = Matrix(b)
+        augmented = A_coeff.row_join(b_vec)
+    else:
+        raise ValueError(f"Unknown method: {method!r}")
     
     # Basic info
-    num_vars = A_coeff.cols
-    num_eqs = A_coeff.rows
-    rank_A = A_coeff.rank()
-    rank_aug = augmented.rank()
+    num_eqs, num_vars = A_coeff.shape
     
-    # RREF
-    rref_matrix, pivot_cols = augmented.rref()
-    free_var_indices = [i for i in range(num_vars) if i not in pivot_cols]
+    # RREF (one elimination of [A | b] gives both ranks and the pivots:
+    # rank([A|b]) counts all pivots, rank(A) only those left of b)
+    if method == "sparse":
+        rref_matrix, pivot_cols = sparse_rref(augmented, tol)
+    elif method == "float":
+        rref_matrix, pivot_cols = rref_float(augmented, tol)
+    elif method == "rational":
+        rref_matrix, pivot_cols = rref_exact(augmented)
+        rref_matrix = Matrix(rref_matrix)
+    else:
+        rref_matrix, pivot_cols = augmented.rref()
+    rank_A = sum(1 for col in pivot_cols if col < num_vars)
+    rank_aug = len(pivot_cols)
+    pivot_set = set(pivot_cols)
+    free_var_indices = [i for i in range(num_vars) if i not in pivot_set]
     
     # Classification
     if rank_A < rank_aug:
@@ -105,7 +374,7 @@ def solve_linear_system(A, b):
         status = "Infinitely many solutions"
         solution_type = "INFINITE"
     
-    return {
+    result = {
         "A": A_coeff,
         "b": b_vec,
         "augmented": augmented,
@@ -120,31 +389,269 @@ def solve_linear_system(A, b):
         "solution_type": solution_type,
         "is_homogeneous": all(val == 0 for val in b),
     }
+    
+    if least_squares:
+        A_float = A_coeff if method == "sparse" else np.array(A_coeff, dtype=np.float64)
+        b_float = np.asarray(b, dtype=np.float64).ravel()
+        result["least_squares"] = least_squares_solve(A_float, b_float, weights)
+    
+    return result
+
+
+def solve_linear_systems_batched(A, b, tol=None, least_squares=False, weights=None):
+    """
+    Solve k linear systems A[i] x = b[i] in one vectorized pass.
+
+    Args:
+        A (np.ndarray): Stacked coefficient matrices, shape (k, m, n)
+        b (np.ndarray): Stacked right-hand sides, shape (k, m)
+        tol: Rank tolerance (scalar, one per system or per system and
+            column), see rref_stack. By default the columns of A and b
+            are each judged on their own scale
+        least_squares (bool): Use the minimum-norm least-squares solution
+            for INCONSISTENT systems instead of NaN; the full
+            least_squares_solve result is stored under 'least_squares'
+        weights: Row weights (k, m) for weighted least squares
+
+    Returns:
+        dict: Solution information as arrays over the k systems.
+        'solutions' holds the unique solution, or the particular solution
+        (free variables = 0) for INFINITE systems, and NaN when INCONSISTENT.
+    """
+    A = np.asarray(A, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    if A.ndim != 3 or b.shape != A.shape[:2]:
+        raise ValueError("A must have shape (k, m, n) and b shape (k, m)")
+
+    k, num_eqs, num_vars = A.shape
+    augmented = np.concatenate([A, b[:, :, np.newaxis]], axis=2)
+
+    # One elimination of [A | b] gives both ranks and the pivots
+    rref_matrix, pivot_mask = rref_stack(augmented, tol)
+    rank_A = pivot_mask[:, :num_vars].sum(axis=1)
+    rank_aug = pivot_mask.sum(axis=1)
+
+    # Classification
+    solution_type = np.where(
+        rank_A < rank_aug, "INCONSISTENT",
+        np.where(rank_A == num_vars, "UNIQUE", "INFINITE"))
+
+    # Pivot variable j is read from the RREF row holding the j-th pivot
+    var_pivots = pivot_mask[:, :num_vars]
+    pivot_row = np.cumsum(var_pivots, axis=1) - 1
+    batch_idx, var_idx = np.nonzero(var_pivots)
+    solutions = np.zeros((k, num_vars))
+    solutions[batch_idx, var_idx] = rref_matrix[batch_idx, pivot_row[batch_idx, var_idx], -1]
+    inconsistent = solution_type == "INCONSISTENT"
+    solutions[inconsistent] = np.nan
+
+    result = {
+        "rref": rref_matrix,
+        "pivot_mask": pivot_mask,
+        "rank_A": rank_A,
+        "rank_aug": rank_aug,
+        "num_vars": num_vars,
+        "num_eqs": num_eqs,
+        "solution_type": solution_type,
+        "solutions": solutions,
+    }
+
+    if least_squares:
+        result["least_squares"] = least_squares_solve(A, b, weights)
+        solutions[inconsistent] = result["least_squares"]["solution"][inconsistent]
+
+    return result
+
+
+def _json_default(value):
+    """Make NumPy and SymPy values JSON serializable."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, tuple):
+        return list(value)
+    return str(value)
+
+
+class ReportWriter:
+    """
+    Streams a formatted report to any file-like sink (default sys.stdout).
+
+    Output is collected in memory and written in chunks of about
+    buffer_size characters, so a long report costs a handful of write()
+    calls instead of one per line. Supported formats:
+    - "text": the console layout (the same as print())
+    - "markdown": headings, bullet lists and matrices in code blocks
+    - "json": one JSON list of records, written as the report goes
+
+    Matrices with more than max_rows rows or max_cols columns are elided to
+    their first and last rows/columns (None shows everything).
+
+    Use it as a context manager, or call close() to write the rest.
+    """
+
+    FORMATS = ("text", "markdown", "json")
 
+    def __init__(self, sink=None, fmt="text", max_rows=20, max_cols=20, buffer_size=65536):
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown report format: {fmt!r}")
+        self.sink = sys.stdout if sink is None else sink
+        self.fmt = fmt
+        self.max_rows = max_rows
+        self.max_cols = max_cols
+        self.buffer_size = buffer_size
+        self._buffer = []
+        self._buffered = 0
+        self._records = 0
 
-def print_system_analysis(result):
-    """Print detailed system analysis"""
-    print("-" * 60)
-    print("COEFFICIENT MATRIX A:")
-    print(format_matrix(result["A"], as_fractions=True))
-    print("-" * 60)
-    print("CONSTANT VECTOR b:")
-    print(format_matrix(result["b"], as_fractions=True))
-    print("-" * 60)
-    print("AUGMENTED MATRIX [A | b]:")
-    print(format_matrix(result["augmented"], as_fractions=True))
-    print("-" * 60)
-    print("RREF OF AUGMENTED MATRIX:")
-    print(format_matrix(result["rref"], as_fractions=True))
-    print("-" * 60)
-    print(f"Rank(A) = {result['rank_A']}, Rank([A|b]) = {result['rank_aug']}")
-    print(f"Number of variables: {result['num_vars']}")
-    print(f"Pivot columns (leading variables): {result['pivot_cols']}")
-    print(f"Free variables: {result['free_var_indices']}")
-    print(f"Number of free variables: {len(result['free_var_indices'])}")
-    print("-" * 60)
-    print(f"STATUS: {result['status']}")
-    print("-" * 60)
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, text):
+        """Append raw text; flushed to the sink once the buffer is full."""
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered text to the sink in one call."""
+        if self._buffer:
+            self.sink.write("".join(self._buffer))
+            self._buffer = []
+            self._buffered = 0
+        if hasattr(self.sink, "flush"):
+            self.sink.flush()
+
+    def close(self):
+        """Finish the document and flush. The sink itself is left open."""
+        if self.fmt == "json":
+            self.write("\n]\n" if self._records else "[]\n")
+            self._records = 0
+        self.flush()
+
+    def _record(self, **record):
+        self.write(("[\n" if self._records == 0 else ",\n")
+                   + json.dumps(record, ensure_ascii=False, default=_json_default))
+        self._records += 1
+
+    def rule(self, char="-", width=60):
+        """Horizontal separator line (text and Markdown only)."""
+        if self.fmt == "text":
+            self.write(char * width + "\n")
+        elif self.fmt == "markdown":
+            self.write("\n---\n")
+
+    def text(self, line=""):
+        """A plain line of text."""
+        if self.fmt == "json":
+            if line.strip():
+                self._record(type="text", text=line.strip())
+        elif self.fmt == "markdown":
+            self.write(line.strip() + "  \n" if line.strip() else "\n")
+        else:
+            self.write(line + "\n")
+
+    def heading(self, title):
+        """A section title."""
+        if self.fmt == "json":
+            self._record(type="heading", text=title.rstrip(":"))
+        elif self.fmt == "markdown":
+            self.write(f"\n#### {title.rstrip(':')}\n\n")
+        else:
+            self.write(title + "\n")
+
+    def fields(self, template, **values):
+        """
+        One line of named values: template.format(**values) in text and
+        Markdown (lists of strings are joined with ", "), the values
+        themselves in JSON.
+        """
+        if self.fmt == "json":
+            self._record(type="fields", values=values)
+            return
+        shown = {}
+        for name, value in values.items():
+            if isinstance(value, list) and value and all(isinstance(v, str) for v in value):
+                value = ", ".join(value)
+            shown[name] = value
+        line = template.format(**shown)
+        if self.fmt == "markdown":
+            self.write(f"- {line.strip()}\n")
+        else:
+            self.write(line + "\n")
+
+    def matrix(self, title, matrix, as_fractions=True):
+        """A titled matrix, elided to max_rows x max_cols."""
+        if self.fmt == "json":
+            rows, cols = matrix.shape
+            row_idx, row_gap = _elide(rows, self.max_rows)
+            col_idx, col_gap = _elide(cols, self.max_cols)
+            sub = _submatrix(matrix, row_idx, col_idx)
+            record = {"type": "matrix", "title": title.rstrip(":"), "shape": [rows, cols],
+                      "rows": _cells(_matrix_key(sub), *sub.shape, as_fractions).tolist()}
+            if row_gap is not None:
+                record["row_indices"] = row_idx.tolist()
+            if col_gap is not None:
+                record["col_indices"] = col_idx.tolist()
+            self._record(**record)
+            return
+
+        self.heading(title)
+        rendered = format_matrix(matrix, as_fractions=as_fractions,
+                                 max_rows=self.max_rows, max_cols=self.max_cols)
+        if self.fmt == "markdown":
+            self.write(f"```\n{rendered}\n```\n")
+        else:
+            self.write(rendered + "\n")
+
+
+def write_report(result, sink=None, fmt="text", **options):
+    """
+    Write the system analysis and the solution of a solve_linear_system
+    result as one report. options are passed on to ReportWriter.
+    """
+    with ReportWriter(sink, fmt, **options) as report:
+        print_system_analysis(result, report)
+        report.text()
+        print_solution(result, report)
+
+
+def print_system_analysis(result, report=None):
+    """
+    Print detailed system analysis.
+
+    Args:
+        result: Result of solve_linear_system
+        report: ReportWriter to write to; by default a text report to stdout
+            (without elision) that is closed at the end
+    """
+    if report is None:
+        with ReportWriter(max_rows=None, max_cols=None) as report:
+            return print_system_analysis(result, report)
+
+    report.rule()
+    report.matrix("COEFFICIENT MATRIX A:", result["A"])
+    report.rule()
+    report.matrix("CONSTANT VECTOR b:", result["b"])
+    report.rule()
+    report.matrix("AUGMENTED MATRIX [A | b]:", result["augmented"])
+    report.rule()
+    report.matrix("RREF OF AUGMENTED MATRIX:", result["rref"])
+    report.rule()
+    report.fields("Rank(A) = {rank_A}, Rank([A|b]) = {rank_aug}",
+                  rank_A=result["rank_A"], rank_aug=result["rank_aug"])
+    report.fields("Number of variables: {num_vars}", num_vars=result["num_vars"])
+    report.fields("Pivot columns (leading variables): {pivot_cols}", pivot_cols=result["pivot_cols"])
+    report.fields("Free variables: {free_vars}", free_vars=result["free_var_indices"])
+    report.fields("Number of free variables: {num_free}", num_free=len(result["free_var_indices"]))
+    report.rule()
+    report.fields("STATUS: {status}", status=result["status"])
+    report.rule()
 
 
 def get_unique_solution(result):
@@ -169,147 +676,169 @@ def get_parametric_solution(result):
     """
     Extract parametric solution for infinite or homogeneous case.
     
+    Everything is read from one slice of the RREF: with pivot rows
+    R[:r] = [I | F | d] (after reordering columns), x_p[pivots] = d and
+    the null-space basis has -F in the pivot rows and I in the free rows.
+    
     Returns:
         dict with:
-        - 'particular': particular solution (non-homogeneous case)
-        - 'basis_vectors': basis vectors for solution space
+        - 'particular': particular solution (free vars = 0), shape (n,)
+        - 'basis': null-space basis vectors as columns, shape (n, f)
         - 'free_vars': free variable indices
     """
     rref = result["rref"]
-    pivot_cols = result["pivot_cols"]
-    free_var_indices = result["free_var_indices"]
     num_vars = result["num_vars"]
+    pivots = np.asarray(result["pivot_cols"][:result["rank_A"]], dtype=np.intp)
+    free = np.asarray(result["free_var_indices"], dtype=np.intp)
+    rank = len(pivots)
+    
+    # Pivot rows: free-variable coefficients and right-hand side
+    if sparse.issparse(rref):
+        top = sparse.csr_matrix(rref)[:rank]
+        coeffs = top[:, free].toarray()
+        rhs = top[:, num_vars].toarray().ravel()
+    else:
+        top = np.array(rref[:rank, :], dtype=np.float64).reshape(rank, num_vars + 1)
+        coeffs = top[:, free]
+        rhs = top[:, num_vars]
     
     # Particular solution (set free vars = 0)
-    particular = {}
-    for i, pivot_col in enumerate(pivot_cols):
-        val = rref[i, -1]
-        particular[f"x{pivot_col + 1}"] = {
-            "decimal": float(val),
-            "fraction": to_fraction(val)
-        }
+    particular = np.zeros(num_vars)
+    particular[pivots] = rhs
     
-    # Basis vectors for homogeneous solution
-    basis_vectors = []
-    for free_var_idx in free_var_indices:
-        vec = {}
-        # Free variable is 1, others are 0
-        for j in range(num_vars):
-            if j == free_var_idx:
-                vec[f"x{j + 1}"] = 1.0
-            elif j in pivot_cols:
-                pivot_row = list(pivot_cols).index(j)
-                val = -rref[pivot_row, free_var_idx]
-                vec[f"x{j + 1}"] = float(val)
-            else:
-                vec[f"x{j + 1}"] = 0.0
-        basis_vectors.append(vec)
+    # Basis vectors for homogeneous solution (0.0 - x avoids -0.0)
+    basis = np.zeros((num_vars, len(free)))
+    basis[pivots] = 0.0 - coeffs
+    basis[free, np.arange(len(free))] = 1.0
     
     return {
         "particular": particular,
-        "basis_vectors": basis_vectors,
-        "free_vars": free_var_indices
+        "basis": basis,
+        "free_vars": result["free_var_indices"]
     }
 
 
-def print_solution(result):
-    """Print solution based on system type"""
+def print_solution(result, report=None):
+    """
+    Print solution based on system type.
+
+    Args:
+        result: Result of solve_linear_system
+        report: ReportWriter to write to; by default a text report to stdout
+    """
+    if report is None:
+        with ReportWriter() as report:
+            return print_solution(result, report)
+
     if result["solution_type"] == "INCONSISTENT":
-        print("✗ No solution exists for this system.")
+        report.heading("✗ No solution exists for this system.")
+        if "least_squares" in result:
+            lsq = result["least_squares"]
+            report.text()
+            report.heading("LEAST-SQUARES SOLUTION (minimum norm):")
+            for i, val in enumerate(lsq["solution"]):
+                report.fields("  {var} = {value:.6f}", var=f"x{i + 1}", value=float(val))
+            report.fields("  Residual norm ||Ax - b|| = {residual_norm:.6g}",
+                          residual_norm=float(lsq["residual_norm"]))
+            report.fields("  Effective rank = {rank}", rank=lsq["rank"])
         return
     
     if result["solution_type"] == "UNIQUE":
-        print("✓ UNIQUE SOLUTION:")
+        report.heading("✓ UNIQUE SOLUTION:")
         solution = get_unique_solution(result)
-        print("\nDecimal:")
+        report.text()
+        report.heading("Decimal:")
         for var, vals in solution.items():
-            print(f"  {var} = {vals['decimal']:.6f}")
-        print("\nFraction:")
+            report.fields("  {var} = {value:.6f}", var=var, value=vals["decimal"])
+        report.text()
+        report.heading("Fraction:")
         for var, vals in solution.items():
-            print(f"  {var} = {vals['fraction']}")
+            report.fields("  {var} = {value}", var=var, value=vals["fraction"])
         return
     
     # INFINITE solutions
     parametric = get_parametric_solution(result)
     is_homogeneous = result["is_homogeneous"]
+    basis = parametric["basis"]
+    
+    # String views, built only now that they are printed
+    basis_decimal = np.char.mod("%.6f", basis).T.tolist()
+    basis_fraction = to_fractions(basis).T.tolist()
     
     if is_homogeneous:
-        print("✓ HOMOGENEOUS SYSTEM (Infinitely many solutions)")
-        print("\nTRIVIAL SOLUTION:")
+        report.heading("✓ HOMOGENEOUS SYSTEM (Infinitely many solutions)")
+        report.text()
+        report.heading("TRIVIAL SOLUTION:")
         for i in range(result["num_vars"]):
-            print(f"  x{i + 1} = 0")
+            report.fields("  {var} = {value}", var=f"x{i + 1}", value=0)
         
-        print("\nGENERAL SOLUTION:")
-        print("x = c₁*v₁ + c₂*v₂ + ... (c₁, c₂, ... ∈ ℝ)")
-        print("\nBASIS VECTORS (Decimal):")
-        for j, vec in enumerate(parametric["basis_vectors"]):
-            vals = [f"{vec[f'x{k+1}']:.6f}" for k in range(result["num_vars"])]
-            print(f"  v{j + 1} = [{', '.join(vals)}]ᵀ")
+        report.text()
+        report.heading("GENERAL SOLUTION:")
+        report.text("x = c₁*v₁ + c₂*v₂ + ... (c₁, c₂, ... ∈ ℝ)")
+        report.text()
+        report.heading("BASIS VECTORS (Decimal):")
+        for j, vals in enumerate(basis_decimal):
+            report.fields("  {vector} = [{entries}]ᵀ", vector=f"v{j + 1}", entries=vals)
         
-        print("\nBASIS VECTORS (Fraction):")
-        for j, vec in enumerate(parametric["basis_vectors"]):
-            vals = [to_fraction(vec[f'x{k+1}']) for k in range(result["num_vars"])]
-            print(f"  v{j + 1} = [{', '.join(vals)}]ᵀ")
+        report.text()
+        report.heading("BASIS VECTORS (Fraction):")
+        for j, vals in enumerate(basis_fraction):
+            report.fields("  {vector} = [{entries}]ᵀ", vector=f"v{j + 1}", entries=vals)
     
     else:
-        print("✓ NON-HOMOGENEOUS SYSTEM (Infinitely many solutions)")
+        report.heading("✓ NON-HOMOGENEOUS SYSTEM (Infinitely many solutions)")
         particular = parametric["particular"]
+        free_set = set(parametric["free_vars"])
+        particular_fraction = to_fractions(particular).tolist()
         
-        print("\nPARTICULAR SOLUTION (free variables = 0):")
-        print("Decimal:")
+        report.text()
+        report.heading("PARTICULAR SOLUTION (free variables = 0):")
+        report.heading("Decimal:")
         for i in range(result["num_vars"]):
-            var_name = f"x{i + 1}"
-            if var_name in particular:
-                print(f"  {var_name} = {particular[var_name]['decimal']:.6f}")
+            if i in free_set:
+                report.fields("  {var} = {value}", var=f"x{i + 1}", value=0)
             else:
-                print(f"  {var_name} = 0")
+                report.fields("  {var} = {value:.6f}", var=f"x{i + 1}", value=particular[i])
         
-        print("Fraction:")
+        report.heading("Fraction:")
         for i in range(result["num_vars"]):
-            var_name = f"x{i + 1}"
-            if var_name in particular:
-                print(f"  {var_name} = {particular[var_name]['fraction']}")
-            else:
-                print(f"  {var_name} = 0")
+            value = "0" if i in free_set else particular_fraction[i]
+            report.fields("  {var} = {value}", var=f"x{i + 1}", value=value)
         
-        print("\nGENERAL SOLUTION:")
-        print("x = x_p + c₁*v₁ + c₂*v₂ + ... (c₁, c₂, ... ∈ ℝ)")
+        report.text()
+        report.heading("GENERAL SOLUTION:")
+        report.text("x = x_p + c₁*v₁ + c₂*v₂ + ... (c₁, c₂, ... ∈ ℝ)")
         
-        print("\nBASIS VECTORS FOR HOMOGENEOUS PART (Decimal):")
-        for j, vec in enumerate(parametric["basis_vectors"]):
-            vals = [f"{vec[f'x{k+1}']:.6f}" for k in range(result["num_vars"])]
-            print(f"  v{j + 1} = [{', '.join(vals)}]ᵀ")
+        report.text()
+        report.heading("BASIS VECTORS FOR HOMOGENEOUS PART (Decimal):")
+        for j, vals in enumerate(basis_decimal):
+            report.fields("  {vector} = [{entries}]ᵀ", vector=f"v{j + 1}", entries=vals)
         
-        print("\nBASIS VECTORS FOR HOMOGENEOUS PART (Fraction):")
-        for j, vec in enumerate(parametric["basis_vectors"]):
-            vals = [to_fraction(vec[f'x{k+1}']) for k in range(result["num_vars"])]
-            print(f"  v{j + 1} = [{', '.join(vals)}]ᵀ")
+        report.text()
+        report.heading("BASIS VECTORS FOR HOMOGENEOUS PART (Fraction):")
+        for j, vals in enumerate(basis_fraction):
+            report.fields("  {vector} = [{entries}]ᵀ", vector=f"v{j + 1}", entries=vals)
         
-        print("\nPARAMETRIC FORM:")
+        report.text()
+        report.heading("PARAMETRIC FORM:")
         for i in range(result["num_vars"]):
-            var_name = f"x{i + 1}"
-            
             # Particular part
-            if var_name in particular:
-                base = f"{particular[var_name]['decimal']:.6f}"
-            else:
-                base = "0"
-            
+            base = "0" if i in free_set else f"{particular[i]:.6f}"
             terms = [base]
             
-            # Add basis vector contributions
-            for j, vec in enumerate(parametric["basis_vectors"]):
-                coeff = vec[var_name]
-                if not np.isclose(coeff, 0):
-                    if np.isclose(coeff, 1):
-                        terms.append(f"c{j + 1}")
-                    elif np.isclose(coeff, -1):
-                        terms.append(f"-c{j + 1}")
-                    else:
-                        terms.append(f"{coeff:.6f}*c{j + 1}")
+            # Add basis vector contributions (only the nonzero ones)
+            row = basis[i]
+            for j in np.flatnonzero(~np.isclose(row, 0)):
+                coeff = row[j]
+                if np.isclose(coeff, 1):
+                    terms.append(f"c{j + 1}")
+                elif np.isclose(coeff, -1):
+                    terms.append(f"-c{j + 1}")
+                else:
+                    terms.append(f"{coeff:.6f}*c{j + 1}")
             
             expr = " + ".join(terms).replace("+ -", "- ")
-            print(f"  {var_name} = {expr}")
+            report.fields("  {var} = {expression}", var=f"x{i + 1}", expression=expr)
 
 
 # ============================================================
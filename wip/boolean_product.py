@@ -1,5 +1,103 @@
 import numpy as np
 
+# boolean_matmul switches to a float32 BLAS product once the packed word
+# pairs exceed m * n * k / BLAS_WORK_RATIO; one packed pair costs about
+# as much as 1000 BLAS multiply-adds with NumPy indexing on one core
+BLAS_WORK_RATIO = 1000
+
+
+def pack_rows(M):
+    """
+    Pack each row of a boolean matrix into uint64 words (64 entries per word).
+    Rows are zero-padded to a whole number of words.
+    """
+    M = np.asarray(M, dtype=bool)
+    rows, cols = M.shape
+    words = -(-cols // 64)
+
+    packed = np.zeros((rows, words * 8), dtype=np.uint8)
+    packed[:, :-(-cols // 8)] = np.packbits(M, axis=1)
+    return packed.view(np.uint64)
+
+
+def boolean_matmul(A, B, block_bytes=64 * 2**20):
+    """
+    Boolean product C[i, j] = OR_k (A[i, k] AND B[k, j]).
+
+    Rows of A and columns of B are packed into uint64 words, so one AND
+    covers 64 values of k. Word w only matters for the rows of A and the
+    columns of B in which it is nonzero, and C is OR-ed together word by
+    word from those blocks, so the work is sum_w rows_w * cols_w. That
+    wins on sparse graphs; once it exceeds m * n * k / BLAS_WORK_RATIO
+    (about where the two meet on one core) the product is taken as a
+    float32 matrix product instead. Sums of zeros and ones cannot round
+    to zero, so C = (A @ B) > 0 is exact in float32 for any k.
+    Temporaries (float32 tiles of A, B and their product, or the word
+    blocks) are kept below block_bytes by working on tiles of rows of A
+    and columns of B; only the packed words and C itself scale with the
+    input.
+    """
+    A = np.asarray(A, dtype=bool)
+    B = np.asarray(B, dtype=bool)
+    if A.ndim != 2 or B.ndim != 2 or A.shape[1] != B.shape[0]:
+        raise ValueError("Incompatible matrix dimensions for boolean product")
+
+    m, k = A.shape
+    n = B.shape[1]
+    C = np.zeros((m, n), dtype=bool)
+    if k == 0:
+        return C
+
+    a_words = np.ascontiguousarray(pack_rows(A).T)      # (words, m): word w of each row of A
+    b_words = np.ascontiguousarray(pack_rows(B.T).T)    # (words, n): word w of each column of B
+    a_counts = np.count_nonzero(a_words, axis=1)
+    b_counts = np.count_nonzero(b_words, axis=1)
+    work = int(a_counts @ b_counts)
+
+    if work * BLAS_WORK_RATIO > m * n * k:
+        # float32 copies of a block of columns of B, a block of rows of A
+        # and their product each take at most a third of block_bytes
+        budget = max(1, block_bytes // 12)
+        col_tile = max(1, budget // k)
+        row_tile = max(1, min(budget // k, budget // col_tile))
+        for col in range(0, n, col_tile):
+            col_stop = min(col + col_tile, n)
+            B32 = B[:, col:col_stop].astype(np.float32)
+            for row in range(0, m, row_tile):
+                row_stop = min(row + row_tile, m)
+                C[row:row_stop, col:col_stop] = A[row:row_stop].astype(np.float32) @ B32 > 0
+        return C
+
+    for w in np.flatnonzero(a_counts * b_counts):
+        rows = np.flatnonzero(a_words[w])
+        cols = np.flatnonzero(b_words[w])
+        b_w = b_words[w, cols]
+        tile = max(1, block_bytes // (cols.size * 8))
+        for start in range(0, rows.size, tile):
+            r = rows[start:start + tile]
+            C[np.ix_(r, cols)] |= (a_words[w, r, np.newaxis] & b_w) != 0
+    return C
+
+
+def transitive_closure(A, reflexive=False):
+    """
+    Transitive closure of a boolean adjacency matrix by repeated squaring.
+    Each step R = R OR (R ⊙ R) doubles the path length covered, so at most
+    about log2(n) boolean products are needed.
+    """
+    R = np.array(A, dtype=bool)
+    if R.ndim != 2 or R.shape[0] != R.shape[1]:
+        raise ValueError("Adjacency matrix must be square")
+    if reflexive:
+        np.fill_diagonal(R, True)
+
+    while True:
+        R_next = R | boolean_matmul(R, R)
+        if np.array_equal(R_next, R):
+            return R
+        R = R_next
+
+
 # Define two boolean matrices
 A = np.array([[True, True, False],
               [True, False, True],
@@ -16,12 +114,7 @@ rows_B, cols_B = B.shape
 if cols_A != rows_B:
     print("Error: incompatible matrix dimensions for boolean product")
 else:
-    C = np.zeros((rows_A, cols_B), dtype=bool)
-    
-    for i in range(rows_A):
-        for j in range(cols_B):
-            # Boolean product: OR of all AND operations
-            C[i, j] = np.any(np.logical_and(A[i, :], B[:, j]))
+    C = boolean_matmul(A, B)
 
 # Print the result
 print("-" * 50)
@@ -32,4 +125,7 @@ print(B.astype(int))
 print("-" * 50)
 print("Boolean Product A ⊙ B:")
 print(C.astype(int))
+print("-" * 50)
+print("Transitive closure of A (reachability):")
+print(transitive_closure(A).astype(int))
 print("=" * 50)
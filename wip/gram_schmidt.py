@@ -1,5 +1,7 @@
 import numpy as np
 
+from orthogonalization import modified_gram_schmidt
+
 # Define a set of linearly independent vectors
 v1 = np.array([1, 1, 0], dtype=np.float64)
 v2 = np.array([1, 0, 1], dtype=np.float64)
@@ -7,18 +9,9 @@ v3 = np.array([0, 1, 1], dtype=np.float64)
 
 vectors = np.array([v1, v2, v3]).T
 
-# Perform Gram-Schmidt orthogonalization
-u_vectors = []
-
-for i in range(vectors.shape[1]):
-    u = vectors[:, i].copy()
-    
-    for j in range(i):
-        u = u - np.dot(u_vectors[j], vectors[:, i]) * u_vectors[j]
-    
-    u_norm = np.linalg.norm(u)
-    u_normalized = u / u_norm
-    u_vectors.append(u_normalized)
+# Perform Gram-Schmidt orthogonalization (modified, with dependence check)
+Q, R, independent = modified_gram_schmidt(vectors)
+u_vectors = [Q[:, i] for i in np.flatnonzero(independent)]
 
 orthonormal_basis = np.array(u_vectors).T
 
@@ -1,28 +1,117 @@
 import numpy as np
-from scipy.linalg import lu
-
-# Define the matrix A as a NumPy array
-A = np.array([[4, 3, 2],
-              [6, 3, 4],
-              [3, 3, 5]], dtype=np.float64)
-
-# Compute LU decomposition using SciPy
-P, L, U = lu(A)
-
-# Print the result
-print("-" * 50)
-print("Matrix A:")
-print(A)
-print("-" * 50)
-print("Permutation matrix P:")
-print(P)
-print("-" * 50)
-print("Lower triangular matrix L:")
-print(L)
-print("-" * 50)
-print("Upper triangular matrix U:")
-print(U)
-print("-" * 50)
-print("Verification: P @ A = L @ U")
-print(np.allclose(P @ A, L @ U))
-print("=" * 50)
+from scipy.linalg import get_lapack_funcs, lu_factor, lu_solve
+
+
+class LUFactorization:
+    """
+    LU factorization with partial pivoting, computed once and reused.
+
+    The factorization is kept in packed LAPACK form: one array holding L
+    (unit diagonal, strictly below) and U (on and above the diagonal) plus
+    the pivot indices. No dense permutation matrix is ever built, and every
+    solve is two triangular solves against the stored factors.
+    """
+
+    def __init__(self, A, check_finite=True):
+        A = np.asarray(A, dtype=np.float64)
+        if A.ndim != 2 or A.shape[0] != A.shape[1]:
+            raise ValueError("Matrix must be square")
+
+        self.n = A.shape[0]
+        self.anorm = np.linalg.norm(A, 1)                 # ||A||_1 for the condition estimate
+        self.lu, self.piv = lu_factor(A, check_finite=check_finite)
+
+    def solve(self, b, trans=0):
+        """Solve A x = b (trans=1: A^T x = b) for a vector or an (n, k) block."""
+        return lu_solve((self.lu, self.piv), b, trans=trans)
+
+    def solve_many(self, rhs):
+        """Solve against right-hand sides streamed in one at a time."""
+        for b in rhs:
+            yield self.solve(b)
+
+    def apply_inverse(self, B, right=False):
+        """
+        Apply A^(-1) without forming it: A^(-1) @ B, or B @ A^(-1) if right.
+        """
+        if right:
+            return self.solve(np.asarray(B).T, trans=1).T
+        return self.solve(B)
+
+    def slogdet(self):
+        """Return (sign, log|det(A)|); det = sign * exp(logabsdet)."""
+        diagonal = np.diagonal(self.lu)
+        if np.any(diagonal == 0):
+            return 0.0, -np.inf
+
+        swaps = np.count_nonzero(self.piv != np.arange(self.n))
+        sign = (-1.0) ** swaps * np.prod(np.sign(diagonal))
+        return float(sign), float(np.sum(np.log(np.abs(diagonal))))
+
+    def det(self):
+        """Determinant of A from the diagonal of U and the pivot parity."""
+        swaps = np.count_nonzero(self.piv != np.arange(self.n))
+        return (-1.0) ** swaps * np.prod(np.diagonal(self.lu))
+
+    def rcond(self):
+        """Estimate the reciprocal 1-norm condition number (LAPACK gecon)."""
+        gecon, = get_lapack_funcs(("gecon",), (self.lu,))
+        rcond, info = gecon(self.lu, self.anorm, norm="1")
+        if info != 0:
+            raise ValueError("Condition number estimation failed")
+        return rcond
+
+    def condition_number(self):
+        """Estimate of cond_1(A) = ||A||_1 * ||A^(-1)||_1."""
+        rcond = self.rcond()
+        return np.inf if rcond == 0 else 1.0 / rcond
+
+    @property
+    def perm(self):
+        """Row permutation as an index vector: A[perm] = L @ U."""
+        perm = np.arange(self.n)
+        for i, p in enumerate(self.piv):
+            perm[i], perm[p] = perm[p], perm[i]
+        return perm
+
+    @property
+    def L(self):
+        return np.tril(self.lu, k=-1) + np.eye(self.n)
+
+    @property
+    def U(self):
+        return np.triu(self.lu)
+
+
+if __name__ == "__main__":
+    # Define the matrix A as a NumPy array
+    A = np.array([[4, 3, 2],
+                  [6, 3, 4],
+                  [3, 3, 5]], dtype=np.float64)
+
+    # Compute LU decomposition once (packed form)
+    lu = LUFactorization(A)
+
+    # Print the result
+    print("-" * 50)
+    print("Matrix A:")
+    print(A)
+    print("-" * 50)
+    print("Row permutation (A[perm] = L @ U):")
+    print(lu.perm)
+    print("-" * 50)
+    print("Lower triangular matrix L:")
+    print(lu.L)
+    print("-" * 50)
+    print("Upper triangular matrix U:")
+    print(lu.U)
+    print("-" * 50)
+    print("Verification: A[perm] = L @ U")
+    print(np.allclose(A[lu.perm], lu.L @ lu.U))
+    print("-" * 50)
+    print("Reusing the factorization:")
+    print(f"  det(A) = {lu.det():.6f}")
+    print(f"  cond_1(A) ≈ {lu.condition_number():.6f}")
+    for x in lu.solve_many([np.array([1.0, 0.0, 0.0]), np.array([9.0, 13.0, 11.0])]):
+        print(f"  x = {x}")
+    print("=" * 50)
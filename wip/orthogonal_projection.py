@@ -1,5 +1,34 @@
 import numpy as np
 
+from orthogonalization import orthonormal_basis
+
+
+class SubspaceProjector:
+    """
+    Orthogonal projector onto the subspace spanned by any set of vectors.
+
+    The spanning set is orthonormalized once with rank-revealing QR, so it
+    may be non-orthogonal or even linearly dependent. Each projection
+    afterwards is two GEMMs: proj(V) = (V @ Q) @ Q^T for a batch of row
+    vectors V, without ever forming the n x n projection matrix.
+    """
+
+    def __init__(self, spanning_vectors, tol=None):
+        """spanning_vectors: shape (n, k), one spanning vector per column."""
+        self.Q = orthonormal_basis(spanning_vectors, tol)
+        self.n, self.rank = self.Q.shape
+
+    def project(self, V, out=None):
+        """Project a vector (n,) or a batch of row vectors (N, n)."""
+        V = np.asarray(V, dtype=np.float64)
+        return np.matmul(V @ self.Q, self.Q.T, out=out)
+
+    def orthogonal_component(self, V):
+        """Component of V orthogonal to the subspace: V - proj(V)."""
+        V = np.asarray(V, dtype=np.float64)
+        return V - self.project(V)
+
+
 # Define a vector to project
 v = np.array([3, 4, 0], dtype=np.float64)
 
@@ -8,10 +37,12 @@ u1 = np.array([1, 0, 0], dtype=np.float64)
 u2 = np.array([0, 1, 0], dtype=np.float64)
 
 # Compute the projection of v onto the subspace spanned by u1 and u2
-proj_v = np.dot(v, u1) * u1 + np.dot(v, u2) * u2
+# (the basis is orthonormalized once, so it need not be orthonormal)
+projector = SubspaceProjector(np.column_stack([u1, u2]))
+proj_v = projector.project(v)
 
 # Compute the component orthogonal to the subspace
-orth_component = v - proj_v
+orth_component = projector.orthogonal_component(v)
 
 # Print the result
 print("-" * 50)
@@ -0,0 +1,173 @@
+import numpy as np
+from scipy import linalg
+
+
+def _default_tol(A):
+    """Dependence tolerance: max(m, n) * eps * ||A||_F."""
+    return max(A.shape) * np.finfo(np.float64).eps * np.linalg.norm(A)
+
+
+def _positive_diagonal(Q, R):
+    """Flip signs so R has a nonnegative diagonal (the Gram-Schmidt convention)."""
+    signs = np.where(np.diagonal(R) < 0, -1.0, 1.0)
+    return Q * signs, R * signs[:, np.newaxis]
+
+
+def modified_gram_schmidt(A, tol=None):
+    """
+    QR factorization by modified Gram-Schmidt.
+
+    Each column is orthogonalized against q_1, ..., q_(j-1) one at a time,
+    projecting the already updated vector, which keeps far better
+    orthogonality than the classical variant on ill-conditioned input.
+    Only vector operations are used, no m x n temporaries.
+
+    Args:
+        A: Matrix whose columns are the vectors, shape (m, n)
+        tol: A column whose remaining norm is <= tol is treated as
+            linearly dependent: its q_j is zero and R[j, j] = 0
+
+    Returns:
+        tuple: (Q, R, independent) with A = Q @ R and a boolean mask of
+        the linearly independent columns
+    """
+    A = np.asarray(A, dtype=np.float64)
+    m, n = A.shape
+    if tol is None:
+        tol = _default_tol(A)
+
+    # Q is built row-wise as Q^T so each q_i is contiguous in memory
+    QT = np.zeros((n, m))
+    R = np.zeros((n, n))
+    independent = np.zeros(n, dtype=bool)
+
+    for j in range(n):
+        v = A[:, j].copy()
+        for i in np.flatnonzero(independent[:j]):
+            R[i, j] = QT[i] @ v
+            v -= R[i, j] * QT[i]
+
+        norm = np.linalg.norm(v)
+        if norm <= tol:
+            continue
+        independent[j] = True
+        R[j, j] = norm
+        QT[j] = v / norm
+
+    return QT.T, R, independent
+
+
+def cgs2(A, tol=None):
+    """
+    QR factorization by classical Gram-Schmidt with reorthogonalization.
+
+    Each column is projected against all previous q's twice with
+    matrix-vector products ("twice is enough"), giving orthogonality at
+    the level of machine precision.
+
+    Returns:
+        tuple: (Q, R, independent), see modified_gram_schmidt
+    """
+    A = np.asarray(A, dtype=np.float64)
+    m, n = A.shape
+    if tol is None:
+        tol = _default_tol(A)
+
+    # Q is built row-wise as Q^T so each q_i is contiguous in memory
+    QT = np.zeros((n, m))
+    R = np.zeros((n, n))
+    independent = np.zeros(n, dtype=bool)
+
+    for j in range(n):
+        v = A[:, j].copy()
+        for _ in range(2):
+            coefficients = QT[:j] @ v
+            v -= coefficients @ QT[:j]
+            R[:j, j] += coefficients
+
+        norm = np.linalg.norm(v)
+        if norm <= tol:
+            continue
+        independent[j] = True
+        R[j, j] = norm
+        QT[j] = v / norm
+
+    return QT.T, R, independent
+
+
+def householder_qr(A, tol=None):
+    """
+    Thin QR factorization by blocked Householder reflections (LAPACK geqrf).
+
+    No Python-level loop over columns. Rank deficiency is detected on the
+    diagonal of R: |R[j, j]| <= tol marks column j as dependent.
+
+    Returns:
+        tuple: (Q, R, independent), see modified_gram_schmidt
+    """
+    A = np.asarray(A, dtype=np.float64)
+    if tol is None:
+        tol = _default_tol(A)
+
+    Q, R = _positive_diagonal(*np.linalg.qr(A))
+    independent = np.abs(np.diagonal(R)) > tol
+    return Q, R, independent
+
+
+def orthonormal_basis(A, tol=None):
+    """
+    Orthonormal basis for the column space of A, correct for any spanning
+    set: column-pivoted Householder QR (rank revealing) keeps only the
+    first rank(A) columns of Q.
+    """
+    A = np.asarray(A, dtype=np.float64)
+    if tol is None:
+        tol = _default_tol(A)
+
+    Q, R, _ = linalg.qr(A, mode="economic", pivoting=True)
+    rank = int(np.count_nonzero(np.abs(np.diagonal(R)) > tol))
+    return Q[:, :rank]
+
+
+def combine_r(R_factors):
+    """
+    Merge the R factors of stacked row blocks into the R of the whole
+    matrix: QR of [R_1; R_2; ...] (the TSQR reduction step).
+
+    Returns:
+        tuple: (Q, R) of the stacked R factors
+    """
+    Q, R = np.linalg.qr(np.vstack(R_factors))
+    return _positive_diagonal(Q, R)
+
+
+def tsqr(A, chunk_rows=65536, tol=None):
+    """
+    Tall-skinny QR: factor row chunks independently, then combine their
+    R factors with one small QR and update each chunk's Q.
+
+    Only (chunk_rows x n) and (chunks * n x n) problems are factored, so
+    it works on very tall matrices (e.g. 1M x 64) in bounded extra memory.
+
+    Returns:
+        tuple: (Q, R, independent), see modified_gram_schmidt
+    """
+    A = np.asarray(A, dtype=np.float64)
+    m, n = A.shape
+    if tol is None:
+        tol = _default_tol(A)
+
+    bounds = list(range(0, m, max(chunk_rows, n))) + [m]
+    local = [np.linalg.qr(A[start:stop]) for start, stop in zip(bounds[:-1], bounds[1:])]
+    Q_top, R = combine_r([R_i for _, R_i in local])
+
+    # Q = blockdiag(Q_i) @ Q_top, one chunk at a time
+    Q = np.empty((m, R.shape[0]))
+    offset = 0
+    for (start, stop), (Q_i, R_i) in zip(zip(bounds[:-1], bounds[1:]), local):
+        k = R_i.shape[0]
+        Q[start:stop] = Q_i @ Q_top[offset:offset + k]
+        offset += k
+
+    independent = np.abs(np.diagonal(R)) > tol
+    return Q, R, independent
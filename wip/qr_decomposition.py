@@ -1,24 +1,115 @@
+import os
+
 import numpy as np
+from scipy.linalg import solve_triangular
+
+from orthogonalization import combine_r
+
+
+def _row_chunks(source, chunk_rows):
+    """
+    Yield float64 row chunks from a .npy path (opened memory-mapped),
+    an array, or an iterator of chunks.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        source = np.load(source, mmap_mode="r")
+    if isinstance(source, np.ndarray):
+        for start in range(0, source.shape[0], chunk_rows):
+            yield np.asarray(source[start:start + chunk_rows], dtype=np.float64)
+    else:
+        for chunk in source:
+            yield np.asarray(chunk, dtype=np.float64)
+
+
+def streaming_qr(A, b=None, chunk_rows=65536):
+    """
+    R factor of a tall matrix that does not fit in memory (streaming TSQR).
+
+    Rows are read chunk by chunk; each chunk is reduced to its R factor and
+    merged into the running R, so memory stays bounded by
+    chunk_rows * n plus a few n x n blocks. Q is never formed. With b the
+    chunks of [A | b] are factored together, which yields Q^T b and the
+    least-squares residual norm as by-products.
+
+    Args:
+        A: .npy path, array (e.g. np.memmap) or iterator of row chunks
+        b: Optional right-hand side in the same form, chunked like A
+            (every chunk must have as many rows as the matching A chunk)
+        chunk_rows: Rows per chunk for paths and arrays
+
+    Returns:
+        np.ndarray R, or the tuple (R, Q^T b, residual_norm) when b is given
+    """
+    b_chunks = _row_chunks(b, chunk_rows) if b is not None else None
+
+    R = None
+    for A_chunk in _row_chunks(A, chunk_rows):
+        block = A_chunk
+        if b_chunks is not None:
+            b_chunk = next(b_chunks, None)
+            if b_chunk is None:
+                raise ValueError("b has fewer rows than A")
+            b_chunk = b_chunk.reshape(b_chunk.shape[0], -1)
+            if b_chunk.shape[0] != A_chunk.shape[0]:
+                raise ValueError(f"b chunk has {b_chunk.shape[0]} rows, "
+                                 f"A chunk has {A_chunk.shape[0]}")
+            block = np.hstack([A_chunk, b_chunk])
+
+        R_chunk = np.linalg.qr(block, mode="r")
+        R = R_chunk if R is None else combine_r([R, R_chunk])[1]
+
+    if R is None:
+        raise ValueError("No rows to factor")
+    if b_chunks is not None and next(b_chunks, None) is not None:
+        raise ValueError("b has more rows than A")
+
+    # Nonnegative diagonal, as for Gram-Schmidt
+    signs = np.where(np.diagonal(R) < 0, -1.0, 1.0)
+    R = R * signs[:, np.newaxis]
+
+    if b is None:
+        return R
+
+    n = A_chunk.shape[1]
+    qtb = R[:n, n:]
+    residual_norm = np.linalg.norm(R[n:, n:], axis=0)
+    if b_chunk.shape[1] == 1:
+        qtb, residual_norm = qtb[:, 0], residual_norm[0]
+    return R[:n, :n], qtb, residual_norm
+
+
+def streaming_least_squares(A, b, chunk_rows=65536):
+    """
+    Least-squares solution of min ||A x - b|| for out-of-core data via
+    streaming_qr: x = R^(-1) Q^T b.
+
+    Returns:
+        tuple: (x, residual_norm)
+    """
+    R, qtb, residual_norm = streaming_qr(A, b, chunk_rows)
+    return solve_triangular(R, qtb), residual_norm
+
+
+if __name__ == "__main__":
+    # Define the matrix A as a NumPy array
+    A = np.array([[1, 1, 0],
+                  [1, 0, 1],
+                  [0, 1, 1]], dtype=np.float64)
+
+    # Compute QR decomposition using NumPy
+    Q, R = np.linalg.qr(A)
 
-# Define the matrix A as a NumPy array
-A = np.array([[1, 1, 0],
-              [1, 0, 1],
-              [0, 1, 1]], dtype=np.float64)
-
-# Compute QR decomposition using NumPy
-Q, R = np.linalg.qr(A)
-
-# Print the result
-print("-" * 50)
-print("Matrix A:")
-print(A)
-print("-" * 50)
-print("Orthonormal matrix Q:")
-print(Q)
-print("-" * 50)
-print("Upper triangular matrix R:")
-print(R)
-print("-" * 50)
-print("Verification: Q @ R = A")
-print(np.allclose(Q @ R, A))
-print("=" * 50)
+    # Print the result
+    print("-" * 50)
+    print("Matrix A:")
+    print(A)
+    print("-" * 50)
+    print("Orthonormal matrix Q:")
+    print(Q)
+    print("-" * 50)
+    print("Upper triangular matrix R:")
+    print(R)
+    print("-" * 50)
+    print("Verification: Q @ R = A")
+    print(np.allclose(Q @ R, A))
+    print("=" * 50)
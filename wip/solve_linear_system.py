@@ -1,6 +1,8 @@
 import numpy as np
 from sympy import Matrix
 
+from lu_decomposition import LUFactorization
+
 # Define the coefficient matrix A and constant vector b
 # System: 2x + 3y + z = 11
 #         x - y + 2z = 8
@@ -11,8 +13,9 @@ A = np.array([[2, 3, 1],
 
 b = np.array([11, 8, 6])
 
-# Solve using NumPy
-x = np.linalg.solve(A, b)
+# Factor A once; further right-hand sides reuse lu.solve(b)
+lu = LUFactorization(A)
+x = lu.solve(b)
 
 # Print the result
 print("-" * 50)
@@ -1,16 +1,78 @@
 import numpy as np
+from scipy.sparse.linalg import eigsh
 from sympy import Matrix
 
+
+def spectral_reconstruct(eigenvalues, V, out=None):
+    """
+    Rebuild A = Σ λ_i v_i v_i^T = V diag(λ) V^T as a single GEMM.
+
+    Args:
+        eigenvalues: The λ_i, shape (k,)
+        V: Orthonormal eigenvectors as columns, shape (n, k)
+        out: Optional preallocated (n, n) array for the result
+
+    Returns:
+        np.ndarray: The (n, n) reconstruction (out, if given)
+    """
+    V = np.asarray(V, dtype=np.float64)
+    eigenvalues = np.asarray(eigenvalues, dtype=np.float64)
+    # Scaling the columns of V is O(nk); no n x n temporary per term
+    return np.matmul(V * eigenvalues, V.T, out=out)
+
+
+def low_rank_approximation(A, k, out=None):
+    """
+    Best rank-k approximation of a symmetric matrix from its k eigenpairs
+    of largest magnitude (Eckart-Young).
+
+    For k much smaller than n only those eigenpairs (plus one for the
+    error bound) are computed with ARPACK; otherwise a full eigh is used.
+
+    Returns:
+        tuple: (A_k, spectral_error, frobenius_error) with
+        ||A - A_k||_2 = |λ_(k+1)| and ||A - A_k||_F = sqrt(Σ_(i>k) λ_i^2)
+    """
+    A = np.asarray(A, dtype=np.float64)
+    n = A.shape[0]
+    if not 0 <= k <= n:
+        raise ValueError("k must be between 0 and n")
+
+    partial = k + 1 < n // 2
+    if partial:
+        eigenvalues, V = eigsh(A, k=k + 1, which="LM")
+    else:
+        eigenvalues, V = np.linalg.eigh(A)
+
+    order = np.argsort(np.abs(eigenvalues))[::-1]
+    top, rest = order[:k], order[k:]
+    A_k = spectral_reconstruct(eigenvalues[top], V[:, top], out=out)
+
+    spectral_error = float(np.abs(eigenvalues[rest[0]])) if rest.size else 0.0
+    if partial:
+        # ||A||_F^2 = Σ λ_i^2, so the tail does not need every eigenvalue
+        tail = np.sum(A * A) - np.sum(eigenvalues[top] ** 2)
+    else:
+        tail = np.sum(eigenvalues[rest] ** 2)
+    frobenius_error = float(np.sqrt(max(tail, 0.0)))
+    return A_k, spectral_error, frobenius_error
+
+
 # Define a symmetric matrix A as a NumPy array
 A = np.array([[4, 1],
               [1, 3]], dtype=np.float64)
 
-# Convert to SymPy Matrix
-sympy_matrix = Matrix(A)
-
-# Compute eigenvalues and eigenvectors
-eigenvals = sympy_matrix.eigenvals()
-eigenvects = sympy_matrix.eigenvects()
+# Compute eigenvalues and eigenvectors once, as (λ, multiplicity, [v]) triples
+# Symmetric relative to the size of A (allclose's absolute 1e-8 would call
+# any small-scale matrix symmetric)
+if np.abs(A - A.T).max() <= 1e-12 * np.abs(A).max():
+    # Symmetric: LAPACK eigh instead of symbolic diagonalization
+    eigenvalues, V = np.linalg.eigh(A)
+    eigenvects = [(val, 1, [V[:, i]]) for i, val in enumerate(eigenvalues)]
+else:
+    # Convert to SymPy Matrix; eigenvects() already carries the multiplicity
+    sympy_matrix = Matrix(A)
+    eigenvects = sympy_matrix.eigenvects()
 
 # Spectral decomposition: A = sum(λ_i * v_i * v_i^T)
 print("-" * 50)
@@ -20,7 +82,9 @@ print("-" * 50)
 print("Spectral Decomposition: A = Σ(λ_i · v_i · v_i^T)")
 print("-" * 50)
 
-spectral_sum = np.zeros_like(A, dtype=np.float64)
+# Collect λ_i and normalized v_i; each term is only formed for display
+eigenvalue_list = []
+vector_list = []
 
 for eigenval, multiplicity, eigenvecs in eigenvects:
     eigenval_float = float(eigenval)
@@ -29,16 +93,25 @@ for eigenval, multiplicity, eigenvecs in eigenvects:
         v = np.array(eigenvec, dtype=np.float64).flatten()
         # Normalize
         v = v / np.linalg.norm(v)
-        # Add to spectral decomposition
-        spectral_sum += eigenval_float * np.outer(v, v)
+        eigenvalue_list.append(eigenval_float)
+        vector_list.append(v)
         print(f"λ = {eigenval}, v = {v}")
-        print(f"λ · v · v^T =")
-        print(eigenval_float * np.outer(v, v))
+        if A.shape[0] <= 6:
+            print(f"λ · v · v^T =")
+            print(eigenval_float * np.outer(v, v))
         print()
 
+# Spectral decomposition as one GEMM: A = V diag(λ) V^T
+spectral_sum = spectral_reconstruct(eigenvalue_list, np.column_stack(vector_list))
+
 print("-" * 50)
 print("Reconstructed matrix A (from spectral decomposition):")
 print(spectral_sum)
 print("\nVerification:")
 print(np.allclose(A, spectral_sum))
+print("-" * 50)
+A_1, spectral_error, frobenius_error = low_rank_approximation(A, 1)
+print("Rank-1 approximation (largest |λ| term):")
+print(A_1)
+print(f"||A - A_1||_2 = {spectral_error:.6f}, ||A - A_1||_F = {frobenius_error:.6f}")
 print("=" * 50)